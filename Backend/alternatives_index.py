@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import numpy as np
+from enrichment_reuse import tokenize
+from category_taxonomy import parse_categories
+from serialization import dump_json, load_json
+
+
+def category_terms(record):
+    """Canonical category ids as matrix terms, e.g. ['cat:image-generators']."""
+    ids = record.get('Categories')
+    if ids is None:
+        ids = [cid for cid, _ in parse_categories(record.get('Category'))]
+    return ["cat:" + cid for cid in ids]
+
+
+class AlternativesBuilder:
+    """
+    Batch job that stores an `Alternatives` list (top-k similar slugs) on
+    every record, for the "You may also like" section of structure.md.
+
+    Records become sparse TF-IDF rows over their category (weighted by
+    `category_weight`, so same-category tools rank first) plus description
+    terms. Description terms found in more than `max_df` of the records are
+    dropped as near-stopwords. Rows are L2-normalized and kept in CSR form
+    (indptr, indices, values), so memory grows with the number of stored
+    terms rather than records x vocabulary, and each stale record is scored
+    only against the records sharing one of its terms.
+
+    Only records that are new, changed, or point at a tool that no longer
+    exists get their neighbours recomputed. Lists shorter than top_k
+    (including empty ones) are also rechecked whenever new tools arrive.
+    """
+    def __init__(self, json_file="ai_tools.json", state_file="alternatives_state.json", top_k=5,
+                 category_weight=3.0, max_df=0.5):
+        self.json_file       = json_file
+        self.state_file      = state_file
+        self.top_k           = top_k
+        self.category_weight = category_weight
+        self.max_df          = max_df
+
+        self.state = {}  # slug -> content hash the Alternatives were computed for
+        if os.path.exists(self.state_file):
+            self.state = load_json(self.state_file)
+
+    @staticmethod
+    def content_hash(record):
+        content = [record.get('Category'), record.get('Description')]
+        return hashlib.sha1(json.dumps(content).encode('utf-8')).hexdigest()[:16]
+
+    # ------------------------------------------------------------------
+    # Matrix
+    # ------------------------------------------------------------------
+
+    def build_matrix(self, records):
+        """Returns the L2-normalized TF-IDF rows in CSR form: (indptr, indices, values), float32 values."""
+        docs = []
+        for record in records:
+            counts = {}
+            for term in category_terms(record):
+                counts[term] = counts.get(term, 0) + self.category_weight
+            for term in tokenize(record.get('Description')):
+                counts[term] = counts.get(term, 0) + 1
+            docs.append(counts)
+
+        df = {}
+        for counts in docs:
+            for term in counts:
+                df[term] = df.get(term, 0) + 1
+        limit  = self.max_df * len(docs)
+        vocab  = [t for t in df if t.startswith("cat:") or df[t] <= limit]
+        column = {term: i for i, term in enumerate(vocab)}
+
+        indptr, indices, weights = [0], [], []
+        for counts in docs:
+            for term, count in counts.items():
+                col = column.get(term)
+                if col is not None:
+                    indices.append(col)
+                    weights.append(count)
+            indptr.append(len(indices))
+
+        indptr   = np.asarray(indptr, dtype=np.int64)
+        indices  = np.asarray(indices, dtype=np.int32)
+        doc_freq = np.array([df[t] for t in vocab], dtype=np.float32)
+        values   = np.asarray(weights, dtype=np.float32) * (np.log((1 + len(docs)) / (1 + doc_freq)) + 1)[indices]
+
+        row_of = np.repeat(np.arange(len(docs)), np.diff(indptr))
+        norms  = np.sqrt(np.bincount(row_of, weights=values * values, minlength=len(docs))).astype(np.float32)
+        norms[norms == 0] = 1
+        values /= norms[row_of]
+        return indptr, indices, values
+
+    @staticmethod
+    def transpose(matrix):
+        """CSR -> CSC: (colptr, rows, values), i.e. for every term the records holding it."""
+        indptr, indices, values = matrix
+        row_of = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+        order  = np.argsort(indices, kind="stable")
+        colptr = np.zeros(int(indices.max(initial=-1)) + 2, dtype=np.int64)
+        np.cumsum(np.bincount(indices), out=colptr[1:])
+        return colptr, row_of[order], values[order]
+
+    def top_neighbours(self, matrix, rows):
+        """Top-k neighbour row indices for each of `rows`, best first."""
+        indptr, indices, values = matrix
+        k = min(self.top_k, len(indptr) - 2)
+        if k <= 0:
+            return {row: [] for row in rows}
+
+        colptr, col_rows, col_values = self.transpose(matrix)
+        result = {}
+        for row in rows:
+            start, end = indptr[row], indptr[row + 1]
+            hits, scores = [], []
+            for term, weight in zip(indices[start:end], values[start:end]):
+                lo, hi = colptr[term], colptr[term + 1]
+                hits.append(col_rows[lo:hi])
+                scores.append(col_values[lo:hi] * weight)
+            if not hits:
+                result[row] = []
+                continue
+
+            # Sparse dot product: sum the shared-term products per candidate record
+            candidates, inverse = np.unique(np.concatenate(hits), return_inverse=True)
+            sims = np.bincount(inverse, weights=np.concatenate(scores))
+            sims[candidates == row] = -np.inf  # never recommend itself
+
+            top = np.argpartition(-sims, k - 1)[:k] if len(sims) > k else np.arange(len(sims))
+            top = top[np.argsort(-sims[top], kind="stable")]
+            result[row] = [int(candidates[j]) for j in top if sims[j] > 0]
+        return result
+
+    # ------------------------------------------------------------------
+    # Job
+    # ------------------------------------------------------------------
+
+    def run(self):
+        """Recomputes Alternatives where needed and saves the catalog. Returns the number updated."""
+        data = load_json(self.json_file)
+
+        records = [r for r in data if r.get('Slug') and not r.get('Duplicate_Of')]
+        slugs   = {r['Slug'] for r in records}
+
+        stale, short = [], []
+        for row, record in enumerate(records):
+            alternatives = record.get('Alternatives')
+            if (alternatives is None
+                    or self.state.get(record['Slug']) != self.content_hash(record)
+                    or any(slug not in slugs for slug in alternatives)):
+                stale.append(row)
+            elif len(alternatives) < self.top_k:
+                short.append(row)
+
+        if short and any(record['Slug'] not in self.state for record in records):
+            stale += short
+
+        if not stale:
+            print("[Alternatives] Nothing to update.")
+            return 0
+
+        matrix     = self.build_matrix(records)
+        neighbours = self.top_neighbours(matrix, stale)
+
+        for row in stale:
+            record = records[row]
+            record['Alternatives'] = [records[j]['Slug'] for j in neighbours[row]]
+            self.state[record['Slug']] = self.content_hash(record)
+
+        dump_json(data, self.json_file)
+        dump_json(self.state, self.state_file)
+
+        print(f"[Alternatives] Updated {len(stale)} of {len(records)} record(s).")
+        return len(stale)
+
+
+if __name__ == "__main__":
+    AlternativesBuilder().run()
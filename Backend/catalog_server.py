@@ -0,0 +1,187 @@
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from aiohttp import web
+from category_taxonomy import CategoryIndex
+from published_catalog import load_published
+from tool_record import ToolRecord
+from serialization import dumps
+
+
+class CachedResponse:
+    """
+    A serialized JSON body with its gzip variant, built once. Each
+    representation has its own strong ETag (the gzip one suffixed "-gzip").
+    """
+    __slots__ = ("body", "gzipped", "etag", "gzip_etag")
+
+    GZIP_MIN_BYTES = 256
+
+    def __init__(self, payload):
+        self.body      = dumps(payload).encode('utf-8')
+        digest         = hashlib.sha1(self.body).hexdigest()[:20]
+        self.etag      = f'"{digest}"'
+        self.gzip_etag = f'"{digest}-gzip"'
+        self.gzipped   = gzip.compress(self.body, 6) if len(self.body) >= self.GZIP_MIN_BYTES else None
+
+
+class CatalogServer:
+    """
+    Read-only HTTP API over the published catalog.
+
+    GET /tools/<slug>                    one record
+    GET /tools?category=<id>&cursor=<n>  a page of [slug, title, label] rows plus next_cursor
+    GET /manifest                        catalog version, size and categories
+
+    Responses are serialized and gzipped once and kept in an LRU keyed by
+    path and query; repeat requests only look up bytes. ETags are strong
+    (hash of the body, per encoding), so clients revalidating get a bodyless 304. The
+    catalog file is re-read when it changes and the LRU is cleared.
+    """
+    def __init__(self, json_file="ai_tools.json", health_file="link_health.json", page_size=50,
+                 cache_size=2048, reload_interval=30):
+        self.json_file       = json_file
+        self.health_file     = health_file
+        self.page_size       = page_size
+        self.cache_size      = cache_size
+        self.reload_interval = reload_interval
+
+        self.cache      = OrderedDict()  # path_qs -> CachedResponse
+        self.by_slug    = {}             # slug -> ToolRecord (compact; expanded only on a cache miss)
+        self.rows       = []             # [slug, title, label] in catalog order
+        self.categories = CategoryIndex()
+        self.category_rows = {}          # category id -> rows
+        self.version    = None
+        self.mtime      = None
+
+    # ------------------------------------------------------------------
+    # Catalog
+    # ------------------------------------------------------------------
+
+    def load(self):
+        records = load_published(self.json_file, self.health_file)
+        self.by_slug    = {r['Slug']: ToolRecord.from_dict(r) for r in records}
+        self.rows       = [[r['Slug'], r.get('Title') or r['Slug'], r.get('Category_Label') or "AI Tool"] for r in records]
+        self.categories = CategoryIndex().build(records)
+        row_of          = {row[0]: row for row in self.rows}
+        self.category_rows = {cid: [row_of[s] for s in slugs] for cid, slugs in self.categories.slugs.items()}
+        self.version    = hashlib.sha1(json.dumps(self.rows).encode('utf-8')
+                                       + str(os.path.getmtime(self.json_file)).encode()).hexdigest()[:12]
+        self.cache.clear()
+        print(f"[Catalog] Loaded {len(records)} tool(s), version {self.version}.")
+
+    async def watch(self, app):
+        """Background task: reload when the catalog file changes."""
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                mtime = os.path.getmtime(self.json_file)
+                if mtime != self.mtime:
+                    self.load()
+                    self.mtime = mtime
+            except (OSError, json.JSONDecodeError):
+                pass  # File may be missing or mid-write; try next cycle
+            except Exception as e:
+                print(f"[Catalog] Unexpected error: {e}")
+
+    # ------------------------------------------------------------------
+    # Responses
+    # ------------------------------------------------------------------
+
+    def cached(self, key, build):
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.move_to_end(key)
+            return entry
+        payload = build()
+        if payload is None:
+            return None
+        entry = self.cache[key] = CachedResponse(payload)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return entry
+
+    def respond(self, request, entry):
+        headers = {"Cache-Control": "public, max-age=60", "Vary": "Accept-Encoding"}
+        body, etag = entry.body, entry.etag
+        if entry.gzipped and "gzip" in request.headers.get("Accept-Encoding", ""):
+            body, etag = entry.gzipped, entry.gzip_etag
+            headers["Content-Encoding"] = "gzip"
+        headers["ETag"] = etag
+        if etag in request.headers.get("If-None-Match", ""):
+            headers.pop("Content-Encoding", None)
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, headers=headers, content_type="application/json")
+
+    def page(self, category, cursor):
+        rows = self.category_rows.get(category) if category else self.rows
+        if rows is None:
+            return None
+        end = cursor + self.page_size
+        return {
+            "tools":       rows[cursor:end],
+            "next_cursor": str(end) if end < len(rows) else None,
+        }
+
+    def tool_payload(self, slug):
+        record = self.by_slug.get(slug)
+        return record.to_dict() if record else None
+
+    # ------------------------------------------------------------------
+    # Handlers
+    # ------------------------------------------------------------------
+
+    async def get_tool(self, request):
+        slug  = request.match_info["slug"]
+        entry = self.cached(request.path_qs, lambda: self.tool_payload(slug))
+        if entry is None:
+            raise web.HTTPNotFound(text='{"error":"unknown tool"}', content_type="application/json")
+        return self.respond(request, entry)
+
+    async def list_tools(self, request):
+        category = request.query.get("category", "")
+        try:
+            cursor = max(0, int(request.query.get("cursor") or 0))
+        except ValueError:
+            raise web.HTTPBadRequest(text='{"error":"invalid cursor"}', content_type="application/json")
+        entry = self.cached(request.path_qs, lambda: self.page(category, cursor))
+        if entry is None:
+            raise web.HTTPNotFound(text='{"error":"unknown category"}', content_type="application/json")
+        return self.respond(request, entry)
+
+    async def get_manifest(self, request):
+        entry = self.cached("/manifest", lambda: {
+            "version":    self.version,
+            "count":      len(self.rows),
+            "page_size":  self.page_size,
+            "categories": {cid: {"label": self.categories.label(cid), "count": len(slugs)}
+                           for cid, slugs in self.categories.slugs.items()},
+        })
+        return self.respond(request, entry)
+
+    def create_app(self):
+        self.load()
+        self.mtime = os.path.getmtime(self.json_file)
+
+        app = web.Application()
+        app.router.add_get("/tools/{slug}", self.get_tool)
+        app.router.add_get("/tools", self.list_tools)
+        app.router.add_get("/manifest", self.get_manifest)
+
+        async def start_watcher(app):
+            app["watcher"] = asyncio.create_task(self.watch(app))
+
+        async def stop_watcher(app):
+            app["watcher"].cancel()
+
+        app.on_startup.append(start_watcher)
+        app.on_cleanup.append(stop_watcher)
+        return app
+
+
+if __name__ == "__main__":
+    server = CatalogServer()
+    web.run_app(server.create_app(), port=int(os.getenv("CATALOG_PORT", "8080")))
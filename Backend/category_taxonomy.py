@@ -0,0 +1,101 @@
+import re
+from serialization import dump_json, load_json
+
+# Source-site badges that are not real categories
+IGNORED_CATEGORIES = {"aixploria selection", "unknown", ""}
+DEFAULT_LABEL      = "AI Tool"
+
+
+def category_id(label):
+    """'Image Generators' -> 'image-generators'"""
+    return re.sub(r"[^a-z0-9]+", "-", str(label).lower()).strip("-")
+
+
+def parse_categories(raw):
+    """
+    Splits a raw listing category into canonical (id, label) pairs.
+    '#AIxploria Selection#Image Generators+1' -> [('image-generators', 'Image Generators')]
+    """
+    pairs = []
+    for part in str(raw or "").split("#"):
+        label = re.sub(r"\+\d+$", "", part).strip()
+        if label.lower() in IGNORED_CATEGORIES:
+            continue
+        cid = category_id(label)
+        if cid and cid not in (p[0] for p in pairs):
+            pairs.append((cid, label))
+    return pairs
+
+
+def annotate(record):
+    """Adds `Categories` (canonical ids) and `Category_Label` (display name) to a record."""
+    pairs = parse_categories(record.get('Category'))
+    record['Categories']     = [cid for cid, _ in pairs]
+    record['Category_Label'] = pairs[0][1] if pairs else DEFAULT_LABEL
+    return pairs
+
+
+class CategoryIndex:
+    """
+    Inverted index: category id -> slugs, plus id -> label.
+
+    Built from the canonical `Categories` / `Category_Label` stored at
+    ingest; raw category strings are only parsed for older records that
+    lack them. The publisher persists it next to the catalog (listed as
+    "categories" in the data manifest), where the home page reads it for
+    ?category= listings, and the catalog server builds one over the
+    published records.
+    """
+    def __init__(self, labels=None, slugs=None):
+        self.labels = labels or {}  # id -> label
+        self.slugs  = slugs or {}   # id -> [slug, ...] in catalog order
+
+    @classmethod
+    def from_dict(cls, index):
+        return cls(index.get("labels"), index.get("slugs"))
+
+    def to_dict(self):
+        return {"labels": self.labels, "slugs": self.slugs}
+
+    def add(self, record):
+        """Indexes one record. The record itself is not modified."""
+        slug = record.get('Slug')
+        if not slug:
+            return
+        ids   = record.get('Categories')
+        pairs = None
+        if ids is None:
+            pairs = parse_categories(record.get('Category'))
+            ids   = [cid for cid, _ in pairs]
+
+        for n, cid in enumerate(ids):
+            if cid not in self.labels:
+                # Category_Label names the first id; others are parsed once per new category
+                if n == 0 and record.get('Category_Label'):
+                    self.labels[cid] = record['Category_Label']
+                else:
+                    pairs = pairs or parse_categories(record.get('Category'))
+                    self.labels[cid] = dict(pairs).get(cid, DEFAULT_LABEL)
+            self.slugs.setdefault(cid, []).append(slug)
+
+    def build(self, records):
+        self.labels, self.slugs = {}, {}
+        for record in records:
+            self.add(record)
+        return self
+
+    def label(self, cid):
+        return self.labels.get(cid, DEFAULT_LABEL)
+
+
+if __name__ == "__main__":
+    # Migration: annotate every existing record
+    OUTPUT_FILE = "ai_tools.json"
+
+    data = load_json(OUTPUT_FILE)
+    for record in data:
+        annotate(record)
+    dump_json(data, OUTPUT_FILE)
+
+    index = CategoryIndex().build(data)
+    print(f"[Categories] Annotated {len(data)} record(s) across {len(index.slugs)} categories.")
@@ -0,0 +1,98 @@
+import gzip
+import os
+
+try:
+    import brotli  # optional: pip install brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = (".json", ".html", ".xml")
+
+# What the publisher writes under site_dir; nothing else there is touched
+PUBLISHED = ("data", "tools", "sitemaps", "sitemap.xml", "feed.xml")
+
+
+class Precompressor:
+    """
+    Writes .gz (and .br when the brotli package is installed) next to every
+    published text artifact, so the host can serve precompressed bytes with
+    no per-request compression. Only the `published` files and directories
+    under site_dir are considered; hand-maintained files are left alone.
+
+    Variants are regenerated only when missing or older than their source,
+    and variants whose source was removed are deleted. Each run reports raw
+    and compressed byte totals per file type.
+    """
+    def __init__(self, site_dir="../Frontend", extensions=COMPRESSIBLE, gzip_level=9, brotli_quality=11,
+                 published=PUBLISHED):
+        self.site_dir       = site_dir
+        self.published      = published
+        self.extensions     = extensions
+        self.gzip_level     = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def variants(self):
+        suffixes = [(".gz", lambda b: gzip.compress(b, self.gzip_level, mtime=0))]
+        if brotli:
+            suffixes.append((".br", lambda b: brotli.compress(b, quality=self.brotli_quality)))
+        return suffixes
+
+    @staticmethod
+    def is_fresh(source, variant):
+        return os.path.exists(variant) and os.path.getmtime(variant) >= os.path.getmtime(source)
+
+    def groups(self):
+        """Yields (directory, names) for the published artifacts and their variants."""
+        for entry in self.published:
+            path = os.path.join(self.site_dir, entry)
+            if os.path.isdir(path):
+                for root, _, files in os.walk(path):
+                    yield root, files
+            else:
+                names = [entry + s for s in ("", ".gz", ".br") if os.path.exists(path + s)]
+                yield self.site_dir, names
+
+    def run(self):
+        """Compresses stale artifacts and prints the size report. Returns {ext: [raw, gz, br]}."""
+        variants = self.variants()
+        totals   = {}
+        written  = 0
+
+        for root, files in self.groups():
+            names = set(files)
+            for name in files:
+                path = os.path.join(root, name)
+                base, suffix = os.path.splitext(name)
+
+                # Orphaned variant: its source is gone
+                if suffix in (".gz", ".br"):
+                    if base not in names:
+                        os.remove(path)
+                    continue
+                if suffix not in self.extensions:
+                    continue
+
+                sizes = totals.setdefault(suffix, [0, 0, 0])
+                sizes[0] += os.path.getsize(path)
+                body = None
+                for i, (ext, compress) in enumerate(variants, start=1):
+                    target = path + ext
+                    if not self.is_fresh(path, target):
+                        if body is None:
+                            with open(path, 'rb') as f:
+                                body = f.read()
+                        with open(target, 'wb') as f:
+                            f.write(compress(body))
+                        written += 1
+                    sizes[i] += os.path.getsize(target)
+
+        self.report(totals, written)
+        return totals
+
+    def report(self, totals, written):
+        print(f"[Compress] {written} variant(s) written{'' if brotli else ' (brotli not installed, gzip only)'}.")
+        for suffix, (raw, gz, br) in sorted(totals.items()):
+            line = f"[Compress]   {suffix:<6} {raw:>10,} B  gzip {gz:>10,} B ({gz / raw:.0%})" if raw else f"[Compress]   {suffix:<6} empty"
+            if brotli and raw:
+                line += f"  br {br:>10,} B ({br / raw:.0%})"
+            print(line)
@@ -0,0 +1,88 @@
+import hashlib
+import os
+from category_taxonomy import CategoryIndex
+from search_index import SearchIndexBuilder
+from serialization import dump_hashed, dump_json, load_json
+
+
+def fnv1a(text):
+    """32-bit FNV-1a over UTF-8; the frontend uses the same function to locate a slug's shard."""
+    h = 0x811c9dc5
+    for byte in text.encode('utf-8'):
+        h ^= byte
+        h = (h * 0x01000193) & 0xffffffff
+    return h
+
+
+class DataManifestWriter:
+    """
+    Publishes the catalog as content-hashed data files plus a tiny manifest.
+
+    manifest.json                    {"version", "shard_count", "index", "shards": [...], "categories", "search": {...}}
+    catalog/index.<hash>.json        [[slug, title, category_label], ...] for the home page
+    catalog/categories.<hash>.json   {"labels": {id: label}, "slugs": {id: [slug, ...]}} (CategoryIndex)
+    catalog/<n>.<hash>.json          full records whose fnv1a(slug) % shard_count == n
+
+    "search" is the listing of the SearchIndexBuilder shards, when given; their
+    doc ids are row positions in the catalog index.
+
+    Only the manifest is revalidated on each visit. Every other file name
+    changes when its content does, so browsers and CDNs may cache them
+    forever and a repeat visit downloads only the shards that changed.
+    Files from the previous manifest are kept one generation so clients
+    holding it can still finish loading.
+    """
+    def __init__(self, out_dir="../Frontend/data", shard_count=16):
+        self.out_dir     = out_dir
+        self.catalog_dir = os.path.join(out_dir, "catalog")
+        self.manifest    = os.path.join(out_dir, "manifest.json")
+        self.shard_count = shard_count
+
+    def load(self):
+        """The manifest currently on disk, or {}."""
+        if os.path.exists(self.manifest):
+            return load_json(self.manifest)
+        return {}
+
+    def write(self, records, search=None):
+        """Writes changed data files and the manifest. Returns the number of data files written."""
+        os.makedirs(self.catalog_dir, exist_ok=True)
+
+        shards = [[] for _ in range(self.shard_count)]
+        for record in records:
+            shards[fnv1a(record['Slug']) % self.shard_count].append(record)
+
+        written = 0
+        index   = [[r['Slug'], r.get('Title') or r['Slug'], r.get('Category_Label') or "AI Tool"] for r in records]
+        index_rel, new = dump_hashed(index, self.out_dir, "catalog/index")
+        written += new
+        categories_rel, new = dump_hashed(CategoryIndex().build(records).to_dict(), self.out_dir, "catalog/categories")
+        written += new
+
+        shard_files = []
+        for n, shard in enumerate(shards):
+            rel, new = dump_hashed(shard, self.out_dir, f"catalog/{n}")
+            shard_files.append(rel)
+            written += new
+
+        previous = self.load()
+
+        versioned = [index_rel, categories_rel] + shard_files + sorted(SearchIndexBuilder.files(search))
+        version   = hashlib.sha256("".join(versioned).encode('utf-8')).hexdigest()[:12]
+        manifest  = {"version": version, "shard_count": self.shard_count, "index": index_rel, "shards": shard_files,
+                     "categories": categories_rel}
+        if search:
+            manifest["search"] = search
+        if previous != manifest:
+            dump_json(manifest, self.manifest)
+
+        # Drop files neither the current nor the previous manifest refers to
+        current = [index_rel, categories_rel] + shard_files
+        older   = [previous.get("index", ""), previous.get("categories", "")] + previous.get("shards", [])
+        keep    = {os.path.basename(p) for p in current + older}
+        for name in os.listdir(self.catalog_dir):
+            if name.endswith(".json") and name not in keep:
+                os.remove(os.path.join(self.catalog_dir, name))
+
+        print(f"[Manifest] Version {version}; {written} data file(s) written.")
+        return written
@@ -0,0 +1,137 @@
+import asyncio
+import os
+import re
+import time
+import aiohttp
+from bs4 import BeautifulSoup
+from http_headers import DEFAULT_HEADERS
+from serialization import dump_json, load_json
+
+PRICING_PATTERN = re.compile(r"(pric|free|freemium|paid|trial|subscription|per month|/mo|\$\s?\d|€\s?\d)", re.IGNORECASE)
+
+
+class DetailPageScraper:
+    """
+    Optional stage that reads each tool's page on the source site.
+
+    Adds `Full_Description`, `Tags` and `Pricing` to the record so the
+    generator can often write its report from this context alone, without
+    searching the web. Pages are fetched concurrently (bounded by
+    `max_concurrency`) and parsed results are cached per URL for `ttl_seconds`;
+    `invalidate()` expires entries early when the source reports a page changed.
+    """
+    def __init__(self, cache_file="detail_cache.json", max_concurrency=6, ttl_seconds=30 * 24 * 3600):
+        self.cache_file = cache_file
+        self.ttl        = ttl_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.headers    = dict(DEFAULT_HEADERS)
+
+        self.cache = {}
+        if os.path.exists(self.cache_file):
+            self.cache = load_json(self.cache_file)
+
+    def save_cache(self):
+        dump_json(self.cache, self.cache_file)
+
+    def invalidate(self, urls):
+        """
+        Marks the cached pages as stale so their next fetch goes to the
+        network. Old details are kept as the fallback if that fetch fails.
+        """
+        stale = 0
+        for url in urls:
+            entry = self.cache.get(url)
+            if entry and entry["fetched_at"]:
+                entry["fetched_at"] = 0
+                stale += 1
+        if stale:
+            self.save_cache()
+        return stale
+
+    # ------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def parse_detail(html):
+        """Extracts the full description, tags and pricing text of a tool page."""
+        soup    = BeautifulSoup(html, 'html.parser')
+        content = soup.select_one('.entry-content') or soup.select_one('article') or soup.body or soup
+
+        paragraphs = [p.get_text(" ", strip=True) for p in content.find_all('p')]
+        paragraphs = [p for p in paragraphs if len(p) > 30]
+
+        tags = []
+        for a in soup.select('a[rel~="tag"], .tags a, .post-tags a, .tag-links a'):
+            tag = a.get_text(strip=True).lstrip('#')
+            if tag and tag not in tags:
+                tags.append(tag)
+
+        pricing = []
+        pricing_elem = soup.select_one('.pricing, .price, .tool-pricing')
+        if pricing_elem:
+            pricing.append(pricing_elem.get_text(" ", strip=True))
+        for node in content.find_all(['li', 'p', 'span']):
+            text = node.get_text(" ", strip=True)
+            if len(text) < 160 and PRICING_PATTERN.search(text) and text not in pricing:
+                pricing.append(text)
+
+        return {
+            'Full_Description': "\n\n".join(paragraphs),
+            'Tags':             tags,
+            'Pricing':          " | ".join(pricing[:3]),
+        }
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    async def fetch_details(self, session, url):
+        """Returns the parsed details of one page, from cache when fresh."""
+        entry = self.cache.get(url)
+        if entry and time.time() - entry["fetched_at"] < self.ttl:
+            return entry["details"]
+
+        async with self._semaphore:
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+            except Exception as e:
+                print(f"[Details] Error fetching {url}: {e}")
+                return entry["details"] if entry else None
+
+        loop = asyncio.get_event_loop()
+        details = await loop.run_in_executor(None, self.parse_detail, html)
+        self.cache[url] = {"fetched_at": int(time.time()), "details": details}
+        return details
+
+    async def enrich(self, session, records):
+        """Adds detail fields to every record with a `Detail_URL`. Returns the number enriched."""
+        targets = [r for r in records if str(r.get('Detail_URL', '')).startswith("http")]
+        results = await asyncio.gather(*(self.fetch_details(session, r['Detail_URL']) for r in targets))
+
+        enriched = 0
+        for record, details in zip(targets, results):
+            if details:
+                record.update(details)
+                enriched += 1
+
+        self.save_cache()
+        return enriched
+
+    async def process_file(self, json_file):
+        """Backfills the detail fields of every record of an existing catalog file."""
+        data = load_json(json_file)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            enriched = await self.enrich(session, data)
+
+        if enriched:
+            dump_json(data, json_file)
+        print(f"[Details] {enriched} record(s) enriched from their detail page.")
+
+
+if __name__ == "__main__":
+    scraper = DetailPageScraper()
+    asyncio.run(scraper.process_file("ai_tools.json"))
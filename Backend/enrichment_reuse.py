@@ -0,0 +1,131 @@
+import math
+import re
+import threading
+from list_fields import LIST_FIELDS, to_list
+
+REPORT_FIELDS = LIST_FIELDS
+
+STOPWORDS = {
+    "a", "an", "and", "the", "of", "to", "for", "with", "in", "on", "your", "you", "is", "it",
+    "by", "or", "from", "that", "this", "its", "at", "as", "be", "are", "into", "ai",
+}
+
+
+def tokenize(text):
+    return [t for t in re.findall(r"[a-z0-9]+", str(text or "").lower()) if t not in STOPWORDS]
+
+
+def is_enriched(record):
+    return bool(to_list(record.get('Key Features')))
+
+
+def report_text(record):
+    """Renders the generated sections of a record back into the report layout."""
+    parts = []
+    for field in REPORT_FIELDS:
+        value = "\n".join(f"* {item}" for item in to_list(record.get(field)))
+        parts.append(f"## {field}\n{value}")
+    return "\n\n".join(parts)
+
+
+class EnrichmentReuse:
+    """
+    Finds the already-enriched tool closest to a new one (TF-IDF cosine on
+    title + description, title terms counted twice) so the generator can
+    update that report instead of researching from scratch.
+
+    Lookups go through an inverted index, so only tools sharing a term with
+    the query are scored. Candidate norms are computed with the same IDF
+    as the query (cached until the corpus changes), so scores stay a true
+    cosine in [0, 1] and the threshold keeps its meaning as tools are added.
+    """
+    def __init__(self, threshold=0.6):
+        self.threshold = threshold
+        self.records   = {}  # slug -> enriched record
+        self.vectors   = {}  # slug -> {term: tf}
+        self.norms     = {}  # slug -> vector norm under the current idf; cleared on every add
+        self.postings  = {}  # term -> set of slugs
+        self._lock     = threading.Lock()  # generator runs in executor threads
+
+    def __len__(self):
+        return len(self.records)
+
+    def _terms(self, title, description):
+        counts = {}
+        for term in tokenize(title) * 2 + tokenize(description):
+            counts[term] = counts.get(term, 0) + 1
+        return counts
+
+    def _idf(self, term):
+        return math.log((1 + len(self.records)) / (1 + len(self.postings.get(term, ())))) + 1
+
+    def _norm(self, vector):
+        return math.sqrt(sum((tf * self._idf(t)) ** 2 for t, tf in vector.items())) or 1.0
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add(self, record):
+        """Indexes one enriched record (ignored if it is not enriched)."""
+        slug = record.get('Slug')
+        if not slug or not is_enriched(record):
+            return
+        with self._lock:
+            vector = self._terms(record.get('Title'), record.get('Description'))
+            self.records[slug] = record
+            self.vectors[slug] = vector
+            for term in vector:
+                self.postings.setdefault(term, set()).add(slug)
+            self.norms.clear()  # idf changed for the whole corpus
+
+    def build(self, records):
+        for record in records:
+            self.add(record)
+        return self
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def find(self, title, description, exclude=None):
+        """Returns (record, score) of the nearest enriched tool above the threshold, or None."""
+        with self._lock:
+            query = self._terms(title, description)
+            if not query:
+                return None
+
+            scores = {}
+            for term, tf in query.items():
+                idf = self._idf(term)
+                for slug in self.postings.get(term, ()):
+                    scores[slug] = scores.get(slug, 0.0) + tf * self.vectors[slug][term] * idf * idf
+
+            q_norm = self._norm(query)
+            best = None
+            for slug, dot in scores.items():
+                if slug == exclude:
+                    continue
+                norm = self.norms.get(slug)
+                if norm is None:
+                    norm = self.norms[slug] = self._norm(self.vectors[slug])
+                score = dot / (q_norm * norm)
+                if score >= self.threshold and (not best or score > best[1]):
+                    best = (self.records[slug], score)
+            return best
+
+
+if __name__ == "__main__":
+    # Sanity check: one early record plus filler; scores must stay a bounded cosine
+    reuse = EnrichmentReuse(threshold=0.0)
+    reuse.add({'Slug': 'grok-4', 'Title': 'Grok 4', 'Key Features': ['x'],
+               'Description': 'Reasoning chatbot from xAI with realtime search.'})
+    for i in range(300):
+        reuse.add({'Slug': f'filler-{i}', 'Title': f'Filler {i}', 'Key Features': ['x'],
+                   'Description': f'Generates images number {i} for designers.'})
+
+    _, self_score = reuse.find('Grok 4', 'Reasoning chatbot from xAI with realtime search.')
+    unrelated = reuse.find('Reasoning Lab', 'reasoning chatbot playground for prompts')
+    assert self_score <= 1.0 + 1e-9, self_score
+    assert unrelated is None or unrelated[1] <= 1.0 + 1e-9, unrelated
+    print(f"[Reuse] self score {self_score:.3f}, unrelated {unrelated[1] if unrelated else 0:.3f}")
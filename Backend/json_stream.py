@@ -0,0 +1,97 @@
+import json
+import re
+
+_decoder    = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_records(path, fields=None, skip=0, where=None, chunk_size=1 << 16):
+    """
+    Yields the records of a JSON array file (the ai_tools.json format) one
+    at a time, reading the file in chunks, so memory stays bounded by the
+    largest single record instead of the whole catalog.
+
+    fields: keep only these keys on each yielded record
+    skip:   number of leading records to pass over
+    where:  predicate on the (projected) record; records failing it are dropped
+
+    Raises json.JSONDecodeError on malformed or truncated files, like json.load,
+    so callers' existing "file may be mid-write" handling still applies.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        buf, pos = "", 0
+
+        def more():
+            """Appends the next chunk (growing with the buffer, so huge records stay linear)."""
+            nonlocal buf, pos
+            chunk = f.read(max(chunk_size, len(buf) - pos))
+            if not chunk:
+                return False
+            buf, pos = buf[pos:] + chunk, 0
+            return True
+
+        def peek(expected):
+            """Next non-whitespace character, reading more as needed."""
+            nonlocal pos
+            while True:
+                pos = _WHITESPACE.match(buf, pos).end()
+                if pos < len(buf):
+                    return buf[pos]
+                if not more():
+                    raise json.JSONDecodeError(f"Expecting {expected}", buf, pos)
+
+        if peek("'['") != "[":
+            raise json.JSONDecodeError("Expecting '['", buf, pos)
+        pos += 1
+
+        index = 0
+        while True:
+            char = peek("',' or ']'")
+            if char == "]":
+                return
+            if index:
+                if char != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                pos += 1
+                peek("value")
+
+            while True:
+                try:
+                    record, end = _decoder.raw_decode(buf, pos)
+                    break
+                except json.JSONDecodeError:
+                    if not more():  # Record cut off by the end of the file
+                        raise
+            pos = end
+
+            index += 1
+            if index <= skip:
+                continue
+            if fields is not None:
+                record = {key: record[key] for key in fields if key in record}
+            if where is None or where(record):
+                yield record
+
+
+if __name__ == "__main__":
+    # Compares peak traced memory of json.load against a projected streaming scan
+    import sys
+    import tracemalloc
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "ai_tools.json"
+
+    tracemalloc.start()
+    with open(path, 'r') as f:
+        loaded = len([r.get('Slug') for r in json.load(f)])
+    full_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    streamed = sum(1 for _ in iter_records(path, fields=('Slug',)))
+    stream_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert loaded == streamed
+    print(f"[Stream] {streamed:,} records")
+    print(f"[Stream]   json.load peak    {full_peak / 1e6:8.1f} MB")
+    print(f"[Stream]   iter_records peak {stream_peak / 1e6:8.1f} MB")
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import os
+import time
+from urllib.parse import urlparse
+import aiohttp
+from link_resolver import LinkResolver
+from rate_limiter import TokenBucket
+from http_headers import DEFAULT_HEADERS
+from serialization import dump_json, load_json
+
+# Responses that prove the site is up even though it refused the bot
+ALIVE_STATUSES = {401, 403, 429}
+
+
+def load_dead_slugs(state_file="link_health.json"):
+    """Slugs currently considered dead. Publishers use this to hide them."""
+    if not os.path.exists(state_file):
+        return set()
+    state = load_json(state_file)
+    return {slug for slug, entry in state.items() if entry.get("dead")}
+
+
+class LinkHealthChecker:
+    """
+    Background checker for every tool `Link` (or `Final_Link`).
+
+    Only links that are due get checked each cycle:
+      - healthy links double their re-check interval up to `max_interval`
+      - a link whose status flips goes back to `min_interval`
+      - failing links back off exponentially up to `max_failure_interval`
+    A link is marked dead after `dead_after` consecutive failures and
+    comes back as soon as one check succeeds.
+
+    Requests are rate-limited per host of the tool's own site. Records
+    without `Final_Link` still point at the source's /out/ redirect, so
+    their destination is looked up through `link_resolver` (sharing its
+    cache) before the check. At most `max_checks_per_cycle` links, the most
+    overdue first, are checked per cycle; the rest wait for the next one.
+    """
+    def __init__(self, json_file="ai_tools.json", state_file="link_health.json", max_connections=20,
+                 per_domain_rate=1.0, min_interval=3600, max_interval=7 * 24 * 3600,
+                 max_failure_interval=24 * 3600, dead_after=3, history_size=10,
+                 link_resolver=None, max_checks_per_cycle=500):
+        self.json_file            = json_file
+        self.state_file           = state_file
+        self.max_connections      = max_connections
+        self.per_domain_rate      = per_domain_rate
+        self.min_interval         = min_interval
+        self.max_interval         = max_interval
+        self.max_failure_interval = max_failure_interval
+        self.dead_after           = dead_after
+        self.history_size         = history_size
+        self.link_resolver        = link_resolver or LinkResolver()
+        self.max_checks_per_cycle = max_checks_per_cycle
+        self._domain_buckets      = {}
+        self.headers              = dict(DEFAULT_HEADERS)
+
+        # slug -> {"url", "history": [[ts, ok, status]], "failures", "interval", "next_check", "dead"}
+        self.state = {}
+        if os.path.exists(self.state_file):
+            self.state = load_json(self.state_file)
+
+    def save_state(self):
+        dump_json(self.state, self.state_file)
+
+    def _domain_bucket(self, url):
+        host = urlparse(url).netloc
+        bucket = self._domain_buckets.get(host)
+        if bucket is None:
+            bucket = self._domain_buckets[host] = TokenBucket(self.per_domain_rate, capacity=1)
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Checking
+    # ------------------------------------------------------------------
+
+    async def check_url(self, session, url):
+        """Returns (ok, status). status is the HTTP code, or the error name."""
+        await self._domain_bucket(url).acquire()
+        try:
+            for method in ("HEAD", "GET"):
+                async with session.request(method, url, allow_redirects=True,
+                                           timeout=aiohttp.ClientTimeout(total=20)) as response:
+                    if method == "HEAD" and response.status in (403, 405, 501):
+                        continue
+                    return response.status < 400 or response.status in ALIVE_STATUSES, response.status
+        except Exception as e:
+            return False, type(e).__name__
+
+    def record_result(self, slug, url, ok, status, now):
+        """Appends the result to the slug's history and schedules its next check."""
+        entry = self.state.setdefault(slug, {"history": [], "failures": 0, "interval": self.min_interval})
+        history = entry["history"]
+        flipped = bool(history) and history[-1][1] != ok
+
+        history.append([int(now), ok, status])
+        del history[:-self.history_size]
+
+        if flipped:
+            entry["interval"] = self.min_interval
+        elif ok:
+            entry["interval"] = min(entry["interval"] * 2, self.max_interval)
+        else:
+            entry["interval"] = min(entry["interval"] * 2, self.max_failure_interval)
+
+        entry["url"]        = url
+        entry["failures"]   = 0 if ok else entry["failures"] + 1
+        entry["dead"]       = entry["failures"] >= self.dead_after
+        entry["next_check"] = int(now + entry["interval"])
+
+    def due_records(self, data, now):
+        """
+        (slug, url, resolved) for links whose next check is due, or whose link
+        changed, most overdue first. `resolved` is False while url is still
+        the source's redirect (no Final_Link yet).
+        """
+        due = []
+        for tool in data:
+            slug = tool.get("Slug")
+            url  = tool.get("Final_Link") or tool.get("Link")
+            if not slug or not str(url).startswith("http"):
+                continue
+            entry = self.state.get(slug)
+            if not entry or entry.get("url") != url or entry["next_check"] <= now:
+                overdue = now - entry["next_check"] if entry and entry.get("url") == url else float("inf")
+                due.append((overdue, slug, url, bool(tool.get("Final_Link"))))
+        due.sort(key=lambda d: -d[0])
+        return [(slug, url, resolved) for _, slug, url, resolved in due]
+
+    async def run_due(self, session, data):
+        """Checks up to max_checks_per_cycle due links concurrently. Returns the number checked."""
+        now = time.time()
+        due = self.due_records(data, now)[:self.max_checks_per_cycle]
+        if not due:
+            return 0
+
+        # Rate limits apply to the tool's own host, not the source's redirect
+        redirects = list({url for _, url, resolved in due if not resolved})
+        finals    = await asyncio.gather(*(self.link_resolver.resolve(session, url) for url in redirects))
+        final_of  = dict(zip(redirects, finals))
+        if redirects:
+            self.link_resolver.save_cache()
+
+        async def check(target):
+            # A redirect that cannot be followed fails like a dead link and backs off the same way
+            return await self.check_url(session, target) if target else (False, "Unresolved")
+
+        checks  = [(slug, url, url if resolved else final_of.get(url)) for slug, url, resolved in due]
+        results = await asyncio.gather(*(check(target) for _, _, target in checks))
+        for (slug, url, _), (ok, status) in zip(checks, results):
+            was_dead = self.state.get(slug, {}).get("dead", False)
+            self.record_result(slug, url, ok, status, now)
+            if self.state[slug]["dead"] != was_dead:
+                print(f"[Health] {slug} is now {'DEAD' if self.state[slug]['dead'] else 'alive'} ({status}).")
+
+        self.save_state()
+        return len(checks)
+
+    # ------------------------------------------------------------------
+    # Main async loop
+    # ------------------------------------------------------------------
+
+    async def monitor_async(self, check_interval=600):
+        """Runs the due checks every `check_interval` seconds."""
+        print("--- Link Health Checker Started ---")
+
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        async with aiohttp.ClientSession(connector=connector, headers=self.headers) as session:
+            while True:
+                if os.path.exists(self.json_file):
+                    try:
+                        data = load_json(self.json_file)
+
+                        checked = await self.run_due(session, data)
+                        if checked:
+                            dead = sum(1 for entry in self.state.values() if entry.get("dead"))
+                            print(f"[Health] Checked {checked} link(s); {dead} dead in total.")
+
+                    except json.JSONDecodeError:
+                        pass  # File may be mid-write; skip this cycle
+                    except Exception as e:
+                        print(f"[Health] Unexpected error: {e}")
+
+                await asyncio.sleep(check_interval)
+
+
+if __name__ == "__main__":
+    checker = LinkHealthChecker()
+    asyncio.run(checker.monitor_async())
@@ -0,0 +1,121 @@
+import asyncio
+import os
+import time
+from urllib.parse import urljoin, urlparse
+import aiohttp
+from http_headers import DEFAULT_HEADERS
+from serialization import dump_json, load_json
+
+
+class LinkResolver:
+    """
+    Follows the aixploria /out/ redirects so visitors land on the tool's
+    site in one hop.
+
+    - redirects are followed hop by hop, each hop limited by a per-host semaphore
+    - results go to a persistent URL -> final-URL cache; entries older
+      than `ttl_seconds` are resolved again, fresh ones cost nothing
+    - records keep `Link` and gain `Final_Link`
+    """
+    MAX_HOPS = 10
+
+    def __init__(self, cache_file="link_cache.json", ttl_seconds=7 * 24 * 3600, per_host_limit=4, max_concurrency=32):
+        self.cache_file      = cache_file
+        self.ttl             = ttl_seconds
+        self.per_host_limit  = per_host_limit
+        self._semaphore      = asyncio.Semaphore(max_concurrency)
+        self._host_limits    = {}
+        self.headers         = dict(DEFAULT_HEADERS)
+
+        self.cache = {}
+        if os.path.exists(self.cache_file):
+            self.cache = load_json(self.cache_file)
+
+    def save_cache(self):
+        dump_json(self.cache, self.cache_file)
+
+    def is_fresh(self, url):
+        entry = self.cache.get(url)
+        return bool(entry) and time.time() - entry["resolved_at"] < self.ttl
+
+    def _host_limit(self, url):
+        host = urlparse(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return limit
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+
+    async def _next_hop(self, session, url):
+        """Returns the redirect target of `url`, or None if it does not redirect."""
+        async with self._host_limit(url):
+            for method in ("HEAD", "GET"):
+                async with session.request(method, url, allow_redirects=False,
+                                           timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    # Some sites refuse HEAD — retry that hop with GET
+                    if method == "HEAD" and response.status in (403, 405, 501):
+                        continue
+                    if 300 <= response.status < 400 and response.headers.get("Location"):
+                        return urljoin(url, response.headers["Location"])
+                    return None
+        return None
+
+    async def resolve(self, session, url):
+        """Returns the final URL for `url`, from cache when fresh."""
+        if self.is_fresh(url):
+            return self.cache[url]["final"]
+
+        async with self._semaphore:
+            current = url
+            try:
+                for _ in range(self.MAX_HOPS):
+                    target = await self._next_hop(session, current)
+                    if not target or target == current:
+                        break
+                    current = target
+            except Exception as e:
+                print(f"[Links] Error resolving {url}: {e}")
+                # Keep serving a stale entry rather than nothing
+                return self.cache.get(url, {}).get("final")
+
+        self.cache[url] = {"final": current, "resolved_at": int(time.time())}
+        return current
+
+    async def resolve_records(self, session, records):
+        """
+        Sets `Final_Link` on every record with an http(s) `Link`. Unique
+        stale or unknown URLs are resolved concurrently. Returns the number
+        of records updated.
+        """
+        urls   = list({r.get('Link') for r in records if str(r.get('Link', '')).startswith("http")})
+        finals = await asyncio.gather(*(self.resolve(session, url) for url in urls))
+        by_url = dict(zip(urls, finals))
+
+        updated = 0
+        for record in records:
+            final = by_url.get(record.get('Link'))
+            if final and record.get('Final_Link') != final:
+                record['Final_Link'] = final
+                updated += 1
+
+        self.save_cache()
+        return updated
+
+    async def process_file(self, json_file):
+        """Resolves every stale link of an existing catalog file."""
+        data = load_json(json_file)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            updated = await self.resolve_records(session, data)
+
+        if updated:
+            dump_json(data, json_file)
+        print(f"[Links] {updated} record(s) updated with a final link.")
+
+
+if __name__ == "__main__":
+    resolver = LinkResolver()
+    asyncio.run(resolver.process_file("ai_tools.json"))
@@ -0,0 +1,47 @@
+import re
+import sys
+from serialization import dump_json, load_json
+
+# Generated report sections stored as lists of strings
+LIST_FIELDS = ('Key Features', 'Pros', 'Cons')
+
+BULLET = re.compile(r"^\s*(?:[*\-•]|\d+[.)])\s+")
+
+
+def to_list(value):
+    """
+    Normalizes a report section into a list of items.
+    '* Fast\\n* Free tier\\n' -> ['Fast', 'Free tier']; lists pass through
+    stripped; missing sections and "N/A" become [].
+    """
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if not value or str(value).strip() == "N/A":
+        return []
+    items = []
+    for line in str(value).splitlines():
+        line = BULLET.sub("", line).strip()
+        if line:
+            items.append(line)
+    return items
+
+
+def normalize(record):
+    """Converts the list fields of a record in place. Returns True if anything changed."""
+    changed = False
+    for field in LIST_FIELDS:
+        if field in record and not isinstance(record[field], list):
+            record[field] = to_list(record[field])
+            changed = True
+    return changed
+
+
+if __name__ == "__main__":
+    # Migration: convert bullet-string fields of existing records to lists
+    OUTPUT_FILE = sys.argv[1] if len(sys.argv) > 1 else "ai_tools.json"
+
+    data = load_json(OUTPUT_FILE)
+    converted = sum(normalize(record) for record in data)
+    if converted:
+        dump_json(data, OUTPUT_FILE)
+    print(f"[Lists] Converted {converted} of {len(data)} record(s).")
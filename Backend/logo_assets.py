@@ -0,0 +1,146 @@
+import asyncio
+import hashlib
+import io
+import os
+import aiohttp
+from PIL import Image
+from http_headers import DEFAULT_HEADERS
+from serialization import dump_json, load_json
+
+
+class LogoAssetPipeline:
+    """
+    Downloads tool logos once and serves them from the site itself.
+
+    - downloads run concurrently, bounded by `max_concurrency`
+    - identical downloads (same bytes from different URLs) are processed once
+    - every logo is normalized to a `size` x `size` PNG
+    - files are stored under content-addressed names (<sha256 prefix>.png),
+      so the same image is never stored twice and the files can be cached forever
+
+    Records keep their original `Logo` URL and gain a `Logo_Local` path
+    relative to the site root.
+    """
+    def __init__(self, asset_dir="../Frontend/assets/logos", public_prefix="assets/logos",
+                 index_file="logo_index.json", size=64, max_concurrency=8):
+        self.asset_dir      = asset_dir
+        self.public_prefix  = public_prefix
+        self.index_file     = index_file
+        self.size           = size
+        self._semaphore     = asyncio.Semaphore(max_concurrency)
+        self.headers        = dict(DEFAULT_HEADERS)
+
+        os.makedirs(self.asset_dir, exist_ok=True)
+
+        # url -> stored file name, raw content hash -> stored file name
+        self.url_index     = {}
+        self.content_index = {}
+        if os.path.exists(self.index_file):
+            index = load_json(self.index_file)
+            self.url_index     = index.get("urls", {})
+            self.content_index = index.get("content", {})
+
+    def save_index(self):
+        dump_json({"urls": self.url_index, "content": self.content_index}, self.index_file)
+
+    # ------------------------------------------------------------------
+    # Download + normalize + store
+    # ------------------------------------------------------------------
+
+    async def fetch_logo(self, session, url):
+        async with self._semaphore:
+            try:
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=20)) as response:
+                    response.raise_for_status()
+                    return await response.read()
+            except Exception as e:
+                print(f"[Logos] Error fetching {url}: {e}")
+                return None
+
+    def normalize(self, raw):
+        """Fits the image into a transparent size x size square and returns PNG bytes."""
+        with Image.open(io.BytesIO(raw)) as img:
+            img = img.convert("RGBA")
+            img.thumbnail((self.size, self.size), Image.LANCZOS)
+            canvas = Image.new("RGBA", (self.size, self.size), (0, 0, 0, 0))
+            canvas.paste(img, ((self.size - img.width) // 2, (self.size - img.height) // 2))
+            out = io.BytesIO()
+            canvas.save(out, format="PNG", optimize=True)
+            return out.getvalue()
+
+    def store(self, raw):
+        """Normalizes and writes raw image bytes; returns the content-addressed file name."""
+        raw_hash = hashlib.sha256(raw).hexdigest()
+        if raw_hash in self.content_index:
+            return self.content_index[raw_hash]
+
+        png  = self.normalize(raw)
+        name = f"{hashlib.sha256(png).hexdigest()[:16]}.png"
+        path = os.path.join(self.asset_dir, name)
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(png)
+
+        self.content_index[raw_hash] = name
+        return name
+
+    async def localize_url(self, session, url):
+        """Returns the stored file name for a logo URL, downloading it if needed."""
+        if url in self.url_index:
+            return self.url_index[url]
+
+        raw = await self.fetch_logo(session, url)
+        if not raw:
+            return None
+
+        loop = asyncio.get_event_loop()
+        try:
+            # Image decoding is CPU work — keep it off the event loop
+            name = await loop.run_in_executor(None, self.store, raw)
+        except Exception as e:
+            print(f"[Logos] Could not process {url}: {e}")
+            return None
+
+        self.url_index[url] = name
+        return name
+
+    # ------------------------------------------------------------------
+    # Record helpers
+    # ------------------------------------------------------------------
+
+    async def localize(self, session, records):
+        """
+        Sets `Logo_Local` on every record with a remote logo. Unique URLs
+        are fetched concurrently. Returns the number of records updated.
+        """
+        urls = {r.get('Logo') for r in records if str(r.get('Logo', '')).startswith("http")}
+        names = await asyncio.gather(*(self.localize_url(session, url) for url in urls))
+        by_url = dict(zip(urls, names))
+
+        updated = 0
+        for record in records:
+            name = by_url.get(record.get('Logo'))
+            if name:
+                local = f"{self.public_prefix}/{name}"
+                if record.get('Logo_Local') != local:
+                    record['Logo_Local'] = local
+                    updated += 1
+
+        self.save_index()
+        return updated
+
+    async def process_file(self, json_file):
+        """Backfills `Logo_Local` for every record of an existing catalog file."""
+        data = load_json(json_file)
+
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            updated = await self.localize(session, data)
+
+        if updated:
+            dump_json(data, json_file)
+        print(f"[Logos] {updated} record(s) now use local logos ({len(set(self.url_index.values()))} unique file(s)).")
+
+
+if __name__ == "__main__":
+    pipeline = LogoAssetPipeline()
+    asyncio.run(pipeline.process_file("ai_tools.json"))
@@ -0,0 +1,126 @@
+import gzip
+import hashlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from bs4 import BeautifulSoup
+from slug_web_scrapping_agent_v04 import AI_Tool_Agent
+from serialization import dump_json, dumps, load_json, loads
+
+# Listing-card fields the extraction owns. Replay overwrites only these,
+# so generator output (Key Features, Pros, Cons...) is left untouched.
+LISTING_FIELDS = ('Title', 'Slug', 'Category', 'Description', 'Link', 'Logo', 'Detail_URL', 'Fingerprint',
+                  'Categories', 'Category_Label')
+
+
+def extract_archived_page(path):
+    """Runs the current listing extraction over one archived page (worker process)."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        soup = BeautifulSoup(f.read(), 'html.parser')
+
+    items = []
+    for item in soup.find_all('div', class_='post-item'):
+        scraped_data = AI_Tool_Agent.parse_post_item(item)
+        if scraped_data:
+            items.append(scraped_data)
+    return items
+
+
+class PageArchive:
+    """
+    Keeps every fetched listing page, gzip-compressed and content-addressed
+    (<sha256>.html.gz), so identical re-fetches cost no extra space.
+
+    index.jsonl records each (url, hash, fetched_at) observation, append-only.
+    `replay()` re-runs the current extraction over the whole archive in
+    parallel across cores and updates the catalog without any network access.
+    """
+    def __init__(self, archive_dir="archive/pages"):
+        self.archive_dir = archive_dir
+        self.index_file  = os.path.join(archive_dir, "index.jsonl")
+        os.makedirs(self.archive_dir, exist_ok=True)
+
+        self._seen = set()  # (url, hash) pairs already in the index
+        for entry in self.entries():
+            self._seen.add((entry["url"], entry["hash"]))
+
+    def path_for(self, content_hash):
+        return os.path.join(self.archive_dir, f"{content_hash}.html.gz")
+
+    def entries(self):
+        """Index entries in the order the pages were fetched."""
+        if not os.path.exists(self.index_file):
+            return []
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            return [loads(line) for line in f if line.strip()]
+
+    def store(self, url, html):
+        """Archives one fetched page. Returns its content hash."""
+        raw          = html.encode('utf-8')
+        content_hash = hashlib.sha256(raw).hexdigest()
+
+        path = self.path_for(content_hash)
+        if not os.path.exists(path):
+            with gzip.open(path, 'wb') as f:
+                f.write(raw)
+
+        if (url, content_hash) not in self._seen:
+            self._seen.add((url, content_hash))
+            entry = {"url": url, "hash": content_hash, "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(dumps(entry) + "\n")
+
+        return content_hash
+
+    # ------------------------------------------------------------------
+    # Offline re-extraction
+    # ------------------------------------------------------------------
+
+    def replay(self, json_file="ai_tools.json", workers=None):
+        """
+        Re-extracts every archived page with the current parsing code and
+        merges the result into `json_file`. Later fetches win over earlier
+        ones; tools not in the catalog yet are added un-enriched, except
+        variants already merged into another record's Aliases.
+        """
+        entries = self.entries()
+        hashes  = list(dict.fromkeys(entry["hash"] for entry in entries))
+        paths   = [self.path_for(h) for h in hashes]
+        print(f"[Archive] Replaying {len(paths)} archived page(s)...")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            extracted = dict(zip(hashes, pool.map(extract_archived_page, paths, chunksize=8)))
+
+        try:
+            data = load_json(json_file)
+        except Exception:
+            data = []
+        by_slug = {entry.get('Slug'): entry for entry in data}
+        aliased = {AI_Tool_Agent.create_slug(alias) for entry in data for alias in entry.get('Aliases') or []}
+
+        updated = added = 0
+        for entry in entries:
+            for item in extracted[entry["hash"]]:
+                record = by_slug.get(item['Slug'])
+                if record is None:
+                    if item['Slug'] in aliased:
+                        continue  # near-duplicate already merged as an alias
+                    record = {**item, 'Scraped_At': entry["fetched_at"]}
+                    data.append(record)
+                    by_slug[item['Slug']] = record
+                    added += 1
+                elif any(record.get(k) != item[k] for k in LISTING_FIELDS):
+                    record.update(item)
+                    updated += 1
+
+        dump_json(data, json_file)
+        print(f"[Archive] Replay done: {updated} record(s) updated, {added} added.")
+
+
+if __name__ == "__main__":
+    # python page_archive.py replay [ai_tools.json]
+    if len(sys.argv) > 1 and sys.argv[1] == "replay":
+        PageArchive().replay(sys.argv[2] if len(sys.argv) > 2 else "ai_tools.json")
+    else:
+        print("Usage: python page_archive.py replay [json_file]")
@@ -0,0 +1,50 @@
+import os
+from itertools import islice
+
+
+class PostedLedger:
+    """
+    Record of every slug already posted to one target.
+
+    Kept as an in-memory set (O(1) membership checks) backed by an
+    append-only file with one slug per line, so a crash can lose at most
+    the line being written and never rewrites earlier progress.
+    """
+    def __init__(self, ledger_file):
+        self.ledger_file = ledger_file
+        self.slugs       = set()
+
+        if os.path.exists(self.ledger_file):
+            with open(self.ledger_file, "r", encoding="utf-8") as f:
+                self.slugs = {line.strip() for line in f if line.strip()}
+
+    def __contains__(self, slug):
+        return slug in self.slugs
+
+    def __len__(self):
+        return len(self.slugs)
+
+    def add(self, slugs):
+        """Marks slugs as posted and appends the new ones to the ledger file."""
+        new = [s for s in dict.fromkeys(slugs) if s and s not in self.slugs]
+        if not new:
+            return
+        with open(self.ledger_file, "a", encoding="utf-8") as f:
+            f.write("".join(f"{s}\n" for s in new))
+        self.slugs.update(new)
+
+    def migrate_from_index(self, index_file, data):
+        """
+        One-time import of the old last_posted_index.txt cursor: every record
+        up to and including that list position counts as posted.
+        """
+        if self.slugs or not os.path.exists(index_file):
+            return
+        try:
+            with open(index_file, "r") as f:
+                last_index = int(f.read().strip())
+        except ValueError:
+            return
+
+        self.add(tool.get("Slug") for tool in islice(data, last_index + 1))
+        print(f"[Ledger] Imported {len(self)} posted slug(s) from {index_file}.")
@@ -0,0 +1,12 @@
+from link_health_checker import load_dead_slugs
+from serialization import load_json
+
+
+def load_published(json_file="ai_tools.json", health_file="link_health.json"):
+    """
+    Records that should be published: tools flagged as duplicates or with
+    dead links are left out. Shared by the site publisher and the catalog API.
+    """
+    data = load_json(json_file)
+    dead = load_dead_slugs(health_file)
+    return [r for r in data if r.get('Slug') and not r.get('Duplicate_Of') and r['Slug'] not in dead]
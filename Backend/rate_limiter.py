@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    `rate` tokens are added per second up to `capacity`. Each acquire()
+    takes one token and waits (without blocking the event loop) until one
+    is available. Waiters are served in arrival order.
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate          = float(rate)
+        self.capacity      = float(capacity)
+        self.tokens        = float(capacity)
+        self.updated_at    = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock         = asyncio.Lock()
+
+    def _refill(self, now):
+        elapsed         = now - self.updated_at
+        self.tokens     = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def pause(self, seconds):
+        """Blocks the bucket for `seconds` (e.g. Telegram's retry_after) and drains it."""
+        now = time.monotonic()
+        self.blocked_until = max(self.blocked_until, now + seconds)
+        self.tokens        = 0.0
+        self.updated_at    = max(now, self.blocked_until)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
@@ -0,0 +1,79 @@
+import os
+import re
+from serialization import dump_hashed
+
+
+def search_terms(text):
+    """Lowercase alphanumeric tokens, same rule as the frontend's search box."""
+    return [t for t in re.findall(r"[a-z0-9]+", str(text or "").lower()) if len(t) > 1]
+
+
+class SearchIndexBuilder:
+    """
+    Emits a compact prebuilt search index for the home page.
+
+    shards/<p>.<hash>.json     {term: [doc ids]} for every term starting with prefix <p>
+
+    Doc ids are positions in `records`, i.e. rows of the catalog index the
+    DataManifestWriter publishes from the same records, which the home page
+    already holds. Shards are content-hashed and `write()` returns their
+    names for the same manifest, so a client always pairs shards with the
+    index they were built against. The browser loads only the shards its
+    query terms fall into and filters without downloading the catalog.
+    """
+    def __init__(self, out_dir="../Frontend/data/search", prefix_len=2):
+        self.out_dir    = out_dir
+        self.shard_dir  = os.path.join(out_dir, "shards")
+        self.prefix_len = prefix_len
+
+    def build(self, records):
+        """Returns {prefix: {term: [doc ids]}}."""
+        postings = {}
+        for doc_id, record in enumerate(records):
+            label = record.get('Category_Label') or "AI Tool"
+            text = " ".join([
+                str(record.get('Title') or ""),
+                " ".join(record.get('Aliases') or []),
+                label,
+                str(record.get('Description') or ""),
+            ])
+            for term in set(search_terms(text)):
+                postings.setdefault(term, []).append(doc_id)
+
+        shards = {}
+        for term, ids in postings.items():
+            shards.setdefault(term[:self.prefix_len], {})[term] = ids
+        return shards
+
+    @staticmethod
+    def files(listing):
+        """Relative paths of every file a `write()` listing refers to."""
+        if not listing:
+            return set()
+        return set(listing["shards"].values())
+
+    def write(self, records, keep=None):
+        """
+        Builds and writes the index. Returns the listing for the manifest:
+        {"prefix_len", "shards": {prefix: path}}, paths relative to out_dir.
+        Files from neither this listing nor `keep` (the previous one) are removed.
+        """
+        os.makedirs(self.shard_dir, exist_ok=True)
+        shards = self.build(records)
+
+        written     = 0
+        shard_files = {}
+        for prefix, terms in sorted(shards.items()):
+            shard_files[prefix], new = dump_hashed(dict(sorted(terms.items())), self.out_dir, f"shards/{prefix}")
+            written += new
+        listing = {"prefix_len": self.prefix_len, "shards": shard_files}
+
+        current = self.files(listing) | self.files(keep)
+        for rel_dir in ("", "shards"):
+            for name in os.listdir(os.path.join(self.out_dir, rel_dir)):
+                rel = f"{rel_dir}/{name}" if rel_dir else name
+                if name.endswith(".json") and rel not in current:
+                    os.remove(os.path.join(self.out_dir, rel))
+
+        print(f"[Search] {len(records)} doc(s), {len(shards)} shard(s); {written} file(s) written.")
+        return listing
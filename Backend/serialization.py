@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+
+# Codec used by every agent for state and catalog files. Picks the fastest
+# installed one unless JSON_CODEC (orjson / ujson / json) forces a choice.
+# Content hashes (fingerprints, page hashes) deliberately keep stdlib
+# json.dumps so their values never depend on the codec installed.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+AVAILABLE = ["json"] + [name for name, module in (("ujson", ujson), ("orjson", orjson)) if module]
+
+
+def _select(name=None):
+    name = name or os.getenv("JSON_CODEC") or AVAILABLE[-1]
+    if name not in AVAILABLE:
+        print(f"[Serialization] Codec {name!r} not installed, using {AVAILABLE[-1]}.")
+        name = AVAILABLE[-1]
+    return name
+
+
+CODEC = _select()
+
+
+def dumps(obj, pretty=False, codec=None):
+    """Serializes to a str: compact by default, indented when pretty."""
+    codec = codec or CODEC
+    if codec == "orjson":
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode('utf-8')
+    if codec == "ujson":
+        return ujson.dumps(obj, ensure_ascii=False, indent=4 if pretty else 0)
+    if pretty:
+        return json.dumps(obj, ensure_ascii=False, indent=4)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(text, codec=None):
+    """Parses JSON text; malformed input always raises json.JSONDecodeError whatever the codec."""
+    codec = codec or CODEC
+    if codec == "orjson":
+        return orjson.loads(text)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if codec == "ujson":
+        try:
+            return ujson.loads(text)
+        except ValueError as e:
+            raise json.JSONDecodeError(str(e), text if isinstance(text, str) else "", 0) from e
+    return json.loads(text)
+
+
+def load_json(path):
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+def dump_json(obj, path, pretty=False):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps(obj, pretty=pretty))
+
+
+def dump_hashed(obj, out_dir, name):
+    """
+    Writes obj as <out_dir>/<name>.<hash>.json, named by its content, unless
+    that file already exists. Returns (path relative to out_dir, written).
+    """
+    body   = dumps(obj)
+    digest = hashlib.sha256(body.encode('utf-8')).hexdigest()[:12]
+    rel    = f"{name}.{digest}.json"
+    path   = os.path.join(out_dir, rel)
+    if os.path.exists(path):
+        return rel, False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(body)
+    return rel, True
+
+
+if __name__ == "__main__":
+    # Micro-benchmark: encode/decode throughput of each installed codec on realistic records
+    import sys
+    import time
+    from tool_record import synthetic_catalog
+
+    N       = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    records = synthetic_catalog(N)
+    size    = len(dumps(records, codec="json").encode('utf-8'))
+    print(f"[Serialization] {N:,} records, {size / 1e6:.1f} MB compact; default codec: {CODEC}")
+
+    for codec in AVAILABLE:
+        start = time.perf_counter()
+        text  = dumps(records, codec=codec)
+        encode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decoded = loads(text, codec=codec)
+        decode = time.perf_counter() - start
+        assert decoded == records
+
+        print(f"[Serialization]   {codec:<7} encode {size / encode / 1e6:7.1f} MB/s   decode {size / decode / 1e6:7.1f} MB/s")
@@ -0,0 +1,160 @@
+import math
+import random
+import re
+import zlib
+
+TLD_PATTERN = re.compile(r"\.(com|ai|io|app|net|org|co|so|dev|tech)$")
+MERSENNE    = (1 << 61) - 1
+
+
+def normalize_title(title):
+    """'ThumbnailCreator.com' and 'Thumbnail Creator' both become 'thumbnailcreator'."""
+    text = TLD_PATTERN.sub("", str(title or "").lower().strip())
+    return re.sub(r"[^a-z0-9]", "", text)
+
+
+def title_trigrams(key):
+    return {key[i:i + 3] for i in range(len(key) - 2)} if len(key) > 2 else {key}
+
+
+def description_shingles(text):
+    words = re.findall(r"[a-z0-9]+", str(text or "").lower())
+    if len(words) < 3:
+        return set(words)
+    return {" ".join(words[i:i + 3]) for i in range(len(words) - 2)}
+
+
+class NearDuplicateIndex:
+    """
+    In-memory index that spots the same tool listed under a variant name.
+
+    - exact match on the normalized title (dict lookup)
+    - title trigram Jaccard through an inverted index with prefix filtering:
+      only the rarest trigrams of the query are probed, so a lookup touches
+      a handful of posting lists even on large catalogs
+    - description MinHash signatures bucketed with LSH (bands x rows)
+
+    Titles that both carry version numbers, and different ones ("Grok 4" vs
+    "Grok 4.20"), are never reported as duplicates.
+    """
+    def __init__(self, title_threshold=0.8, description_threshold=0.85, num_perm=32, bands=8, seed=42):
+        self.title_threshold       = title_threshold
+        self.description_threshold = description_threshold
+        self.num_perm              = num_perm
+        self.bands                 = bands
+        self.rows                  = num_perm // bands
+
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, MERSENNE), rng.randrange(0, MERSENNE)) for _ in range(num_perm)]
+
+        self.by_key     = {}  # normalized title -> slug
+        self.trigrams   = {}  # slug -> trigram set
+        self.digits     = {}  # slug -> version digits of the title
+        self.signatures = {}  # slug -> MinHash signature
+        self.postings   = {}  # trigram -> set of slugs
+        self.buckets    = [{} for _ in range(bands)]  # band -> {band values: set of slugs}
+
+    def __len__(self):
+        return len(self.trigrams)
+
+    # ------------------------------------------------------------------
+    # MinHash
+    # ------------------------------------------------------------------
+
+    def signature(self, description):
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in description_shingles(description)]
+        if not hashes:
+            return None
+        return tuple(min((a * h + b) % MERSENNE for h in hashes) for a, b in self._perms)
+
+    def _bands(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    def add(self, slug, title, description):
+        key   = normalize_title(title)
+        grams = title_trigrams(key)
+
+        self.by_key.setdefault(key, slug)
+        self.trigrams[slug] = grams
+        self.digits[slug]   = re.findall(r"\d+", str(title or ""))
+        for gram in grams:
+            self.postings.setdefault(gram, set()).add(slug)
+
+        signature = self.signature(description)
+        if signature:
+            self.signatures[slug] = signature
+            for band, values in self._bands(signature):
+                self.buckets[band].setdefault(values, set()).add(slug)
+
+    def build(self, records):
+        for record in records:
+            if record.get("Slug") and not record.get("Duplicate_Of"):
+                self.add(record["Slug"], record.get("Title"), record.get("Description"))
+        return self
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def _other_version(self, slug, digits):
+        other = self.digits[slug]
+        return bool(digits) and bool(other) and digits != other
+
+    def find(self, title, description, exclude=None):
+        """
+        Returns (slug, score, reason) for the closest near-duplicate already
+        in the index, or None. `reason` is 'title' or 'description'.
+        """
+        key    = normalize_title(title)
+        digits = re.findall(r"\d+", str(title or ""))
+
+        slug = self.by_key.get(key)
+        if slug and slug != exclude:
+            return slug, 1.0, "title"
+
+        # Title trigrams — prefix filter on the rarest trigrams
+        grams = title_trigrams(key)
+        if grams:
+            ordered   = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+            min_share = math.ceil(self.title_threshold * len(grams))
+            probe     = ordered[:len(grams) - min_share + 1]
+            candidates = set()
+            for gram in probe:
+                candidates.update(self.postings.get(gram, ()))
+
+            best = None
+            for candidate in candidates:
+                if candidate == exclude or self._other_version(candidate, digits):
+                    continue
+                other  = self.trigrams[candidate]
+                shared = len(grams & other)
+                score  = shared / (len(grams) + len(other) - shared)
+                if score >= self.title_threshold and (not best or score > best[1]):
+                    best = (candidate, score, "title")
+            if best:
+                return best
+
+        # Description MinHash via LSH buckets
+        signature = self.signature(description)
+        if signature:
+            candidates = set()
+            for band, values in self._bands(signature):
+                candidates.update(self.buckets[band].get(values, ()))
+
+            best = None
+            for candidate in candidates:
+                if candidate == exclude or self._other_version(candidate, digits):
+                    continue
+                other = self.signatures[candidate]
+                score = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm
+                if score >= self.description_threshold and (not best or score > best[1]):
+                    best = (candidate, score, "description")
+            if best:
+                return best
+
+        return None
@@ -0,0 +1,162 @@
+import os
+import time
+from xml.sax.saxutils import escape, quoteattr
+from serialization import dump_json, load_json
+
+SITE_URL = os.getenv("SITE_URL", "https://tool-hive-ai.vercel.app").rstrip("/")
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+
+def record_time(record, fields=("Updated_At", "Generated_At", "Scraped_At")):
+    """Epoch seconds of the first timestamp field present on the record, else 0."""
+    for field in fields:
+        stamp = record.get(field)
+        if not stamp:
+            continue
+        try:
+            return time.mktime(time.strptime(stamp, "%Y-%m-%d %H:%M:%S"))
+        except (TypeError, ValueError):
+            continue
+    return 0
+
+
+def write_if_changed(path, body):
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == body:
+                return False
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(body)
+    return True
+
+
+class SitemapWriter:
+    """
+    Maintains sitemap.xml (an index) plus sitemaps/sitemap-<n>.xml chunks.
+
+    Slugs are assigned to chunks append-only and never move, so a new tool
+    lands in the last chunk and only chunks whose members (or their lastmod)
+    changed are rewritten. Removed tools leave their chunk slightly short
+    rather than shifting every later chunk.
+    """
+    def __init__(self, site_dir="../Frontend", state_file="sitemap_build.json", chunk_size=5000, site_url=SITE_URL):
+        self.site_dir   = site_dir
+        self.chunk_dir  = os.path.join(site_dir, "sitemaps")
+        self.state_file = state_file
+        self.chunk_size = chunk_size
+        self.site_url   = site_url
+
+        self.chunks  = []  # [[slug, ...], ...] in assignment order
+        self.lastmod = {}  # slug -> YYYY-MM-DD
+        if os.path.exists(self.state_file):
+            state = load_json(self.state_file)
+            self.chunks  = state.get("chunks", [])
+            self.lastmod = state.get("lastmod", {})
+
+    def tool_url(self, slug):
+        return f"{self.site_url}/tools/{slug}.html"
+
+    def render_chunk(self, slugs):
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<urlset xmlns="{SITEMAP_NS}">']
+        for slug in slugs:
+            lines.append(f"<url><loc>{escape(self.tool_url(slug))}</loc><lastmod>{self.lastmod[slug]}</lastmod></url>")
+        lines.append("</urlset>")
+        return "\n".join(lines) + "\n"
+
+    def render_index(self):
+        lines = ['<?xml version="1.0" encoding="UTF-8"?>', f'<sitemapindex xmlns="{SITEMAP_NS}">']
+        for n, slugs in enumerate(self.chunks):
+            lastmod = max((self.lastmod[s] for s in slugs), default=None)
+            entry = f"<sitemap><loc>{self.site_url}/sitemaps/sitemap-{n}.xml</loc>"
+            if lastmod:
+                entry += f"<lastmod>{lastmod}</lastmod>"
+            lines.append(entry + "</sitemap>")
+        lines.append("</sitemapindex>")
+        return "\n".join(lines) + "\n"
+
+    def write(self, records):
+        """Updates chunk assignment and rewrites touched chunks. Returns the number of files written."""
+        os.makedirs(self.chunk_dir, exist_ok=True)
+        current = {}
+        for record in records:
+            stamp = record_time(record)
+            current[record['Slug']] = time.strftime("%Y-%m-%d", time.localtime(stamp)) if stamp else "1970-01-01"
+
+        dirty = set()
+        for n, slugs in enumerate(self.chunks):
+            kept = [s for s in slugs if s in current]
+            if len(kept) != len(slugs) or any(self.lastmod.get(s) != current[s] for s in kept):
+                dirty.add(n)
+            self.chunks[n] = kept
+
+        assigned = {s for slugs in self.chunks for s in slugs}
+        for slug in current:
+            if slug in assigned:
+                continue
+            if not self.chunks or len(self.chunks[-1]) >= self.chunk_size:
+                self.chunks.append([])
+            self.chunks[-1].append(slug)
+            dirty.add(len(self.chunks) - 1)
+        self.lastmod = current
+
+        written = 0
+        for n in sorted(dirty):
+            path = os.path.join(self.chunk_dir, f"sitemap-{n}.xml")
+            written += write_if_changed(path, self.render_chunk(self.chunks[n]))
+        written += write_if_changed(os.path.join(self.site_dir, "sitemap.xml"), self.render_index())
+
+        dump_json({"chunks": self.chunks, "lastmod": self.lastmod}, self.state_file)
+
+        print(f"[Sitemap] {len(current)} URL(s) in {len(self.chunks)} chunk(s); {written} file(s) written.")
+        return written
+
+
+class FeedWriter:
+    """
+    Writes feed.xml, an Atom feed of the most recently added tools
+    (Generated_At, else Scraped_At). The file is only rewritten when the
+    set of entries changes.
+    """
+    def __init__(self, site_dir="../Frontend", size=50, site_url=SITE_URL, title="ToolHive AI - New Tools"):
+        self.path     = os.path.join(site_dir, "feed.xml")
+        self.size     = size
+        self.site_url = site_url
+        self.title    = title
+
+    @staticmethod
+    def iso(stamp):
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(stamp))
+
+    def render(self, recent):
+        updated = self.iso(recent[0][0]) if recent else self.iso(0)
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<feed xmlns="http://www.w3.org/2005/Atom">',
+            f"<title>{escape(self.title)}</title>",
+            f'<link href="{self.site_url}/feed.xml" rel="self"/>',
+            f'<link href="{self.site_url}/"/>',
+            f"<id>{self.site_url}/</id>",
+            f"<updated>{updated}</updated>",
+        ]
+        for stamp, record in recent:
+            url = f"{self.site_url}/tools/{record['Slug']}.html"
+            lines += [
+                "<entry>",
+                f"<title>{escape(record.get('Title') or record['Slug'])}</title>",
+                f'<link href="{escape(url)}"/>',
+                f"<id>{escape(url)}</id>",
+                f"<updated>{self.iso(stamp)}</updated>",
+                f"<category term={quoteattr(record.get('Category_Label') or 'AI Tool')}/>",
+                f"<summary>{escape(record.get('Description') or '')}</summary>",
+                "</entry>",
+            ]
+        lines.append("</feed>")
+        return "\n".join(lines) + "\n"
+
+    def write(self, records):
+        stamped = [(record_time(r, ("Generated_At", "Scraped_At")), r) for r in records]
+        recent  = sorted((p for p in stamped if p[0]), key=lambda p: -p[0])[:self.size]
+        written = write_if_changed(self.path, self.render(recent))
+        print(f"[Feed] {len(recent)} entr{'y' if len(recent) == 1 else 'ies'}; {'updated' if written else 'unchanged'}.")
+        return written
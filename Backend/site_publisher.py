@@ -0,0 +1,58 @@
+import asyncio
+import json
+import os
+from compressed_artifacts import Precompressor
+from data_manifest import DataManifestWriter
+from published_catalog import load_published
+from search_index import SearchIndexBuilder
+from site_feeds import FeedWriter, SitemapWriter
+from static_site import StaticSiteBuilder
+
+
+class SitePublisher:
+    """
+    Turns the working catalog (ai_tools.json) into the static files the
+    frontend serves. Tools flagged as duplicates or with dead links are left
+    out of everything published.
+    """
+    def __init__(self, json_file="ai_tools.json", site_dir="../Frontend", health_file="link_health.json"):
+        self.json_file   = json_file
+        self.site_dir    = site_dir
+        self.health_file = health_file
+        self.manifest    = DataManifestWriter(out_dir=os.path.join(site_dir, "data"))
+        self.search      = SearchIndexBuilder(out_dir=os.path.join(site_dir, "data", "search"))
+        self.pages       = StaticSiteBuilder(out_dir=os.path.join(site_dir, "tools"))
+        self.sitemap     = SitemapWriter(site_dir=site_dir)
+        self.feed        = FeedWriter(site_dir=site_dir)
+        self.compressor  = Precompressor(site_dir=site_dir)
+
+    def publish(self):
+        records = load_published(self.json_file, self.health_file)
+        print(f"[Publisher] Publishing {len(records)} tool(s)...")
+        search = self.search.write(records, keep=self.manifest.load().get("search"))
+        self.manifest.write(records, search=search)
+        self.pages.build(records)
+        self.sitemap.write(records)
+        self.feed.write(records)
+        self.compressor.run()
+
+    async def monitor_and_publish_async(self, check_interval=60):
+        """Republishes whenever the catalog file changes."""
+        print("--- Site Publisher Started ---")
+        last_mtime = None
+        while True:
+            if os.path.exists(self.json_file):
+                mtime = os.path.getmtime(self.json_file)
+                if mtime != last_mtime:
+                    try:
+                        self.publish()
+                        last_mtime = mtime
+                    except json.JSONDecodeError:
+                        pass  # File may be mid-write; skip this cycle
+                    except Exception as e:
+                        print(f"[Publisher] Unexpected error: {e}")
+            await asyncio.sleep(check_interval)
+
+
+if __name__ == "__main__":
+    SitePublisher().publish()
@@ -0,0 +1,130 @@
+import gzip
+import os
+import re
+import xml.etree.ElementTree as ET
+from serialization import dump_json, load_json
+
+
+class SitemapDiscovery:
+    """
+    Finds new or changed pages from the source site's sitemaps instead of
+    re-walking every paginated listing.
+
+    Child sitemaps whose <lastmod> has not moved since the last run are not
+    even downloaded. Of the URLs inside the changed ones, only those that
+    are new or have a newer <lastmod> are returned, split into listing
+    pages (category / free-ai style pages) and tool detail pages.
+
+    Call `commit()` with the pages that were actually processed so failed
+    ones (and a crash mid-run) are re-discovered next time. A child
+    sitemap's lastmod is only committed once every page found in it was.
+    """
+    def __init__(self, sitemap_url="https://www.aixploria.com/sitemap_index.xml", state_file="sitemap_state.json",
+                 listing_pattern=r"/en/(category/[^/]+|free-ai|ai-freemium)/?$",
+                 detail_pattern=r"/en/[^/]+/?$"):
+        self.sitemap_url     = sitemap_url
+        self.state_file      = state_file
+        self.listing_pattern = re.compile(listing_pattern)
+        self.detail_pattern  = re.compile(detail_pattern)
+
+        # {"sitemaps": {sitemap_url: lastmod}, "urls": {url: lastmod}}
+        self.state = {"sitemaps": {}, "urls": {}}
+        if os.path.exists(self.state_file):
+            self.state = load_json(self.state_file)
+        self._pending = None
+
+    # ------------------------------------------------------------------
+    # XML helpers
+    # ------------------------------------------------------------------
+
+    async def fetch_xml(self, session, url):
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                raw = await response.read()
+            if url.endswith(".gz"):
+                raw = gzip.decompress(raw)
+            return ET.fromstring(raw)
+        except Exception as e:
+            print(f"[Sitemap] Error fetching {url}: {e}")
+            return None
+
+    @staticmethod
+    def parse_entries(root):
+        """Returns (kind, [(loc, lastmod)]) where kind is 'sitemapindex' or 'urlset'."""
+        kind    = root.tag.split('}')[-1]
+        entries = []
+        for node in root:
+            fields = {child.tag.split('}')[-1]: (child.text or "").strip() for child in node}
+            if fields.get("loc"):
+                entries.append((fields["loc"], fields.get("lastmod", "")))
+        return kind, entries
+
+    # ------------------------------------------------------------------
+    # Discovery
+    # ------------------------------------------------------------------
+
+    async def discover(self, session):
+        """Returns (listing_urls, detail_urls) that are new or changed since the last commit."""
+        root = await self.fetch_xml(session, self.sitemap_url)
+        if root is None:
+            return [], []
+
+        kind, entries = self.parse_entries(root)
+        known_sitemaps = self.state["sitemaps"]
+        known_urls     = self.state["urls"]
+        new_sitemaps   = {}
+        new_urls       = {}
+        source         = {}  # url -> child sitemap it was listed in
+
+        if kind == "urlset":
+            url_entries = entries
+        else:
+            url_entries = []
+            fetched = 0
+            for loc, lastmod in entries:
+                if lastmod and known_sitemaps.get(loc) == lastmod:
+                    continue  # unchanged child sitemap — skip the download
+                child = await self.fetch_xml(session, loc)
+                if child is None:
+                    continue
+                fetched += 1
+                child_entries = self.parse_entries(child)[1]
+                url_entries.extend(child_entries)
+                source.update((child_loc, loc) for child_loc, _ in child_entries)
+                new_sitemaps[loc] = lastmod
+            print(f"[Sitemap] {fetched}/{len(entries)} child sitemap(s) changed.")
+
+        listing_urls, detail_urls = [], []
+        for loc, lastmod in url_entries:
+            if loc in known_urls and (not lastmod or known_urls[loc] >= lastmod):
+                continue
+            if self.listing_pattern.search(loc):
+                listing_urls.append(loc)
+            elif self.detail_pattern.search(loc):
+                detail_urls.append(loc)
+            else:
+                continue  # neither kind — nothing will process it
+            new_urls[loc] = lastmod
+
+        self._pending = (new_sitemaps, new_urls, source)
+        print(f"[Sitemap] {len(listing_urls)} listing page(s) and {len(detail_urls)} detail page(s) new or changed.")
+        return listing_urls, detail_urls
+
+    def commit(self, processed=None):
+        """
+        Persists the lastmod values seen by the last discover() call.
+        With `processed`, only those URLs are committed, and only child
+        sitemaps none of whose pages are still outstanding.
+        """
+        if not self._pending:
+            return
+        new_sitemaps, new_urls, source = self._pending
+        if processed is not None:
+            outstanding  = {source.get(url) for url in new_urls if url not in processed}
+            new_urls     = {url: lastmod for url, lastmod in new_urls.items() if url in processed}
+            new_sitemaps = {loc: lastmod for loc, lastmod in new_sitemaps.items() if loc not in outstanding}
+        self.state["sitemaps"].update(new_sitemaps)
+        self.state["urls"].update(new_urls)
+        dump_json(self.state, self.state_file)
+        self._pending = None
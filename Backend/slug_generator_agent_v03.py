@@ -6,12 +6,31 @@ from dotenv import load_dotenv
 from agno.agent import Agent
 from agno.models.google import Gemini
 from agno.tools.duckduckgo import DuckDuckGoTools
+from enrichment_reuse import EnrichmentReuse, report_text
+from list_fields import to_list
+from json_stream import iter_records
+from serialization import dump_json, load_json
 
 load_dotenv()
 
 class ContentGenerator:
-    def __init__(self, output_json="ai_tools.json"):
+    # A Full_Description at least this long is enough to skip web research
+    MIN_CONTEXT_CHARS = 400
+
+    def __init__(self, output_json="ai_tools.json", reuse_threshold=None):
+        """
+        reuse_threshold: when set, a new tool whose title + description is at
+        least this similar (cosine, 0-1) to an already-enriched tool gets that
+        tool's report updated by the tool-less writer instead of a full
+        research run.
+        """
         self.output_json = output_json
+        self.reuse       = None
+
+        if reuse_threshold is not None:
+            self.reuse = EnrichmentReuse(threshold=reuse_threshold)
+            if os.path.exists(self.output_json):
+                self.reuse.build(load_json(self.output_json))
 
         # Initialize the Agno Agent
         # Note: CsvTools removed since we no longer use a CSV as input.
@@ -29,16 +48,66 @@ class ContentGenerator:
             markdown=False
         )
 
-    def generate_and_parse(self, tool_name, tool_desc, tool_slug):
+        # Same analyst without web search — used when the scraped detail page
+        # already gives enough context, which saves the research round-trips.
+        self.writer = Agent(
+            model=Gemini(id="gemini-2.5-flash-lite"),
+            description="You are an expert AI analyst who writes concise, structured reports from the material you are given.",
+            instructions=[
+                "Use only the context provided about the tool.",
+                "Do not invent features; if information is missing, state that.",
+                "STRICT FORMATTING RULE: You must output only the report section names in MARKDOWN format using specific headers (## or ###).",
+                "DON'T USE MARKDOWN for other texts except section headings in the report."
+            ],
+            markdown=False
+        )
+
+    def generate_and_parse(self, tool_name, tool_desc, tool_slug, context=None):
         """
         Calls the AI agent to generate Key Features, Pros, and Cons for a tool.
         Returns a dict with those fields (and a Generated_At timestamp).
         This is called by the scraper inline — before writing to JSON.
+
+        context: optional record with detail-page fields (Full_Description,
+        Tags, Pricing). When the description is rich enough the report is
+        written from it directly, skipping web research.
+
+        With reuse enabled, a closely related enriched tool's report is
+        updated instead (recorded as Reused_From).
         """
-        print(f"\n[Generator] Researching: {tool_name}...")
+        context   = context or {}
+        raw_desc  = tool_desc
+        full_desc = context.get('Full_Description') or ""
+        agent     = self.agent
+        prior     = self.reuse.find(tool_name, tool_desc, exclude=tool_slug) if self.reuse else None
+
+        if len(full_desc) >= self.MIN_CONTEXT_CHARS:
+            tool_desc = (
+                f"{tool_desc}\n\n{full_desc}\n\n"
+                f"Tags: {', '.join(context.get('Tags') or [])}\n"
+                f"Pricing: {context.get('Pricing') or 'unknown'}"
+            )
+
+        if prior:
+            prior_record, score = prior
+            agent = self.writer
+            print(f"\n[Generator] Updating prior report of '{prior_record.get('Title')}' ({score:.2f}) for: {tool_name}...")
+            tool_desc = f"{tool_desc}\n\nPrior report:\n{report_text(prior_record)}"
+            intro = (
+                f'Update the prior report below for the AI tool named "{tool_name}". '
+                f'It was written for the closely related tool "{prior_record.get("Title")}": '
+                f'keep what still applies and correct or drop what differs.'
+            )
+        elif len(full_desc) >= self.MIN_CONTEXT_CHARS:
+            agent = self.writer
+            print(f"\n[Generator] Writing from page context: {tool_name}...")
+            intro = f'Write a report on the AI tool named "{tool_name}" using this context.'
+        else:
+            print(f"\n[Generator] Researching: {tool_name}...")
+            intro = f'Research the AI tool named "{tool_name}".'
 
         prompt = f"""
-        Research the AI tool named "{tool_name}".
+        {intro}
         Context provided: "{tool_desc}".
 
         You MUST generate the report using the following Markdown headers EXACTLY.
@@ -58,7 +127,7 @@ class ContentGenerator:
         """
 
         try:
-            response = self.agent.run(prompt)
+            response = agent.run(prompt)
             content = response.content
         except Exception as e:
             print(f"[!] Error generating content for {tool_name}: {e}")
@@ -70,11 +139,17 @@ class ContentGenerator:
         cons_match     = re.search(r"##\s*Cons(.*?)(?=##|$)", content, re.DOTALL | re.IGNORECASE)
 
         generated_data = {
-            'Key Features': features_match.group(1).strip() if features_match else "N/A",
-            'Pros':         pros_match.group(1).strip()     if pros_match     else "N/A",
-            'Cons':         cons_match.group(1).strip()     if cons_match     else "N/A",
+            'Key Features': to_list(features_match.group(1)) if features_match else [],
+            'Pros':         to_list(pros_match.group(1))     if pros_match     else [],
+            'Cons':         to_list(cons_match.group(1))     if cons_match     else [],
             'Generated_At': time.strftime("%Y-%m-%d %H:%M:%S")
         }
+        if prior:
+            generated_data['Reused_From'] = prior[0].get('Slug')
+
+        if self.reuse:
+            # Later tools of the same family can build on this report
+            self.reuse.add({'Title': tool_name, 'Slug': tool_slug, 'Description': raw_desc, **generated_data})
 
         print(f"[Generator] Content ready for: {tool_name}")
         return generated_data
@@ -95,6 +170,12 @@ class StandaloneGeneratorMonitor:
         self.check_interval = check_interval
         self.generator = ContentGenerator(output_json=json_file)
 
+    @staticmethod
+    def needs_enrichment(entry):
+        # Key Features missing means the generator has not run yet
+        # (an empty list means generation ran and found nothing)
+        return entry.get('Key Features') is None and not entry.get('Duplicate_Of')
+
     def run(self):
         print("--- Standalone Generator Monitor Started ---")
         print(f"[*] Watching {self.json_file} for un-enriched entries...")
@@ -102,25 +183,26 @@ class StandaloneGeneratorMonitor:
         while True:
             if os.path.exists(self.json_file):
                 try:
-                    with open(self.json_file, 'r') as f:
-                        data = json.load(f)
-
-                    updated = False
-                    for i, entry in enumerate(data):
-                        # If Key Features is missing, this entry needs enrichment
-                        if not entry.get('Key Features'):
-                            tool_name = entry.get('Title', 'Unknown')
-                            tool_desc = entry.get('Description', '')
-                            tool_slug = entry.get('Slug', '')
-
-                            generated_data = self.generator.generate_and_parse(tool_name, tool_desc, tool_slug)
-                            data[i] = {**entry, **generated_data}
-                            updated = True
-
-                    if updated:
-                        with open(self.json_file, 'w') as f:
-                            json.dump(data, f, indent=4)
-                        print("[Generator] JSON file updated with enriched entries.")
+                    # Cheap streamed scan first; the full catalog is only loaded when there is work
+                    pending = next(iter_records(self.json_file, fields=('Key Features', 'Duplicate_Of'),
+                                                where=self.needs_enrichment), None)
+                    if pending is not None:
+                        data = load_json(self.json_file)
+
+                        updated = False
+                        for i, entry in enumerate(data):
+                            if self.needs_enrichment(entry):
+                                tool_name = entry.get('Title', 'Unknown')
+                                tool_desc = entry.get('Description', '')
+                                tool_slug = entry.get('Slug', '')
+
+                                generated_data = self.generator.generate_and_parse(tool_name, tool_desc, tool_slug, entry)
+                                data[i] = {**entry, **generated_data}
+                                updated = True
+
+                        if updated:
+                            dump_json(data, self.json_file)
+                            print("[Generator] JSON file updated with enriched entries.")
 
                 except json.JSONDecodeError:
                     pass  # File may be mid-write; skip this cycle
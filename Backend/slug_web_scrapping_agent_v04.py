@@ -4,9 +4,14 @@ from bs4 import BeautifulSoup
 import os
 import re
 import json
+import hashlib
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
+from category_taxonomy import annotate
+from json_stream import iter_records
+from http_headers import DEFAULT_HEADERS
+from serialization import dump_json, load_json
 
 load_dotenv()
 
@@ -16,21 +21,24 @@ load_dotenv()
 #                        e.g. for https://api.npoint.io/abc123  →  abc123
 # NPOINT_SECRET_TOKEN →  the secret token npoint gives you to
 #                        authenticate POST requests (Optional)
+# PRETTY_JSON         →  set to 1 to also write an indented copy of the
+#                        output file (<name>.pretty.json) for reading
 # ============================================================
 
 
 class AI_Tool_Agent:
-    def __init__(self, start_url, output_file="ai_tools.json", interval_seconds=3600):
+    def __init__(self, start_url, output_file="ai_tools.json", interval_seconds=3600, page_archive=None):
         self.current_url      = start_url
         self.output_file      = output_file
         self.interval         = interval_seconds
+        self.page_archive     = page_archive  # optional PageArchive: keeps every fetched listing page
         self.npoint_id        = os.getenv("NPOINT_ENDPOINT_ID")
         self.npoint_token     = os.getenv("NPOINT_SECRET_TOKEN") # [FIXED] Uncommented
         self.npoint_api_url   = f"https://api.npoint.io/{self.npoint_id}" if self.npoint_id else None
+        self.pretty_copy      = os.getenv("PRETTY_JSON", "").lower() in ("1", "true", "yes")
         self._executor        = ThreadPoolExecutor()
-        self.headers          = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
+        self.discovered_detail_urls = []  # filled by sitemap discovery, see run()
+        self.headers          = dict(DEFAULT_HEADERS)
 
         # [FIXED] Safely check variables without causing an AttributeError
         if not self.npoint_id:
@@ -38,15 +46,15 @@ class AI_Tool_Agent:
 
         # Initialize local JSON file if it doesn't exist
         if not os.path.exists(self.output_file):
-            with open(self.output_file, 'w') as f:
-                json.dump([], f)
+            dump_json([], self.output_file)
             print(f"[Scraper] Created output file: {self.output_file}")
 
     # ------------------------------------------------------------------
     # Slug helper
     # ------------------------------------------------------------------
 
-    def create_slug(self, text):
+    @staticmethod
+    def create_slug(text):
         if not isinstance(text, str):
             return "unknown-tool"
         text = text.lower()
@@ -63,41 +71,103 @@ class AI_Tool_Agent:
             print(f"[Scraper] Navigating to: {url}")
             async with session.get(url) as response:
                 response.raise_for_status()
-                return BeautifulSoup(await response.text(), 'html.parser')
+                html = await response.text()
+            if self.page_archive:
+                self.page_archive.store(url, html)
+            return BeautifulSoup(html, 'html.parser')
         except Exception as e:
             print(f"[Scraper] Error fetching page: {e}")
             return None
 
-    def extract_category(self, post_item):
+    @staticmethod
+    def extract_category(post_item):
         for selector in ['.category', '.cat-links', 'span.term-badge', '.post-category']:
             cat_elem = post_item.select_one(selector)
             if cat_elem:
                 return cat_elem.get_text(strip=True)
         return "Unknown"
 
+    @staticmethod
+    def compute_fingerprint(entry):
+        """Short hash of the listing-card content, used to spot changes on later crawls."""
+        content = [entry.get(k) for k in ('Title', 'Category', 'Description', 'Link', 'Logo')]
+        return hashlib.sha1(json.dumps(content).encode('utf-8')).hexdigest()[:16]
+
+    @staticmethod
+    def parse_post_item(item):
+        """
+        Extracts the listing-card fields of one `div.post-item`.
+        Returns None for cards without tool data. Static (no network, no
+        state) so archived pages can be re-parsed in worker processes.
+        """
+        data_element = item.find('div', class_='share-dialog')
+        if not data_element:
+            return None
+
+        title       = data_element.get('data-title')
+        description = data_element.get('data-description')
+        category    = AI_Tool_Agent.extract_category(item)
+
+        # Extract direct tool link from the visit button
+        visit_btn = item.find('a', class_='visit-site-button4')
+        link = visit_btn['href'] if visit_btn and visit_btn.get('href') else "Unknown"
+
+        # Tool page on the source site (share URL, else the title link)
+        detail_url = data_element.get('data-url')
+        if not detail_url:
+            title_link = item.select_one('h2 a, h3 a, a.post-title, a[rel="bookmark"]')
+            detail_url = title_link['href'] if title_link and title_link.get('href') else "Unknown"
+
+        # Extract logo
+        logo_src = "Unknown"
+        logo_div = item.find('div', class_='favicon-cat-brand')
+        if logo_div:
+            img_tag = logo_div.find('img')
+            if img_tag and 'src' in img_tag.attrs:
+                logo_src = img_tag['src']
+
+        scraped_data = {
+            'Title':       title,
+            'Slug':        AI_Tool_Agent.create_slug(title),
+            'Category':    category,
+            'Description': description,
+            'Link':        link,
+            'Logo':        logo_src,
+            'Detail_URL':  detail_url,
+        }
+        scraped_data['Fingerprint'] = AI_Tool_Agent.compute_fingerprint(scraped_data)
+        annotate(scraped_data)  # canonical Categories ids + Category_Label
+        return scraped_data
+
     # ------------------------------------------------------------------
     # Local JSON helpers
     # ------------------------------------------------------------------
 
-    def get_existing_slugs(self):
+    def get_existing_fingerprints(self):
+        """Slug -> listing fingerprint. Older records without one get it computed."""
+        fields = ('Slug', 'Fingerprint', 'Title', 'Category', 'Description', 'Link', 'Logo')
+        try:
+            return {entry.get('Slug'): entry.get('Fingerprint') or self.compute_fingerprint(entry)
+                    for entry in iter_records(self.output_file, fields=fields)}
+        except Exception:
+            return {}
+
+    def load_local(self):
         try:
-            with open(self.output_file, 'r') as f:
-                data = json.load(f)
-            return {entry.get('Slug') for entry in data}
+            return load_json(self.output_file)
         except Exception:
-            return set()
+            return []
 
     def save_locally(self, data):
-        """Write the full data list to the local JSON file."""
-        with open(self.output_file, 'w') as f:
-            # Used indent=4 to keep the local JSON pretty-printed
-            json.dump(data, f, indent=4)
+        """Write the full data list to the local JSON file (compact; pretty copy only if PRETTY_JSON is set)."""
+        dump_json(data, self.output_file)
+        if self.pretty_copy:
+            dump_json(data, os.path.splitext(self.output_file)[0] + ".pretty.json", pretty=True)
 
     def append_to_local(self, entry):
         """Append a single merged entry to the local JSON file."""
         try:
-            with open(self.output_file, 'r') as f:
-                data = json.load(f)
+            data = load_json(self.output_file)
         except Exception:
             data = []
 
@@ -106,6 +176,54 @@ class AI_Tool_Agent:
         print(f"[Scraper] Saved locally: {entry['Title']} (Slug: {entry['Slug']})")
         return data  # return full list so we can push it to npoint immediately
 
+    def update_local(self, entry):
+        """Merge a refreshed entry into the existing record with the same slug."""
+        try:
+            data = load_json(self.output_file)
+        except Exception:
+            data = []
+
+        for i, existing in enumerate(data):
+            if existing.get('Slug') == entry['Slug']:
+                data[i] = {**existing, **entry}
+                break
+        else:
+            data.append(entry)
+
+        self.save_locally(data)
+        print(f"[Scraper] Updated locally: {entry['Title']} (Slug: {entry['Slug']})")
+        return data
+
+    def add_alias(self, slug, alias):
+        """
+        Record a near-duplicate's title as an alias of the existing tool.
+        Returns the full list if it changed, else None.
+        """
+        data = self.load_local()
+        for entry in data:
+            if entry.get('Slug') == slug:
+                aliases = entry.get('Aliases', [])
+                if alias not in aliases and alias != entry.get('Title'):
+                    entry['Aliases'] = aliases + [alias]
+                    self.save_locally(data)
+                    return data
+                break
+        return None
+
+    async def refresh_details(self, session, detail_scraper, urls, skip=()):
+        """
+        Re-reads changed detail pages of tools already in the catalog.
+        Returns the full list if any record was updated, else None.
+        """
+        urls    = set(urls)
+        data    = self.load_local()
+        targets = [r for r in data if r.get('Detail_URL') in urls and r.get('Slug') not in skip]
+        if not targets or not await detail_scraper.enrich(session, targets):
+            return None
+        self.save_locally(data)
+        print(f"[Scraper] Refreshed details of {len(targets)} existing tool(s).")
+        return data
+
     # ------------------------------------------------------------------
     # npoint sync — push the full updated list via POST
     # ------------------------------------------------------------------
@@ -141,14 +259,35 @@ class AI_Tool_Agent:
     # Main async loop
     # ------------------------------------------------------------------
 
-    async def run(self, generator=None, extra_urls = None):
+    async def run(self, generator=None, extra_urls = None, logo_pipeline=None, link_resolver=None, discovery=None,
+                  detail_scraper=None, refresh=False, reenrich_on_change=True,
+                  dedup_index=None, near_duplicate="merge"):
         """
-        For each scraped tool:
-          1. Build raw scraped_data dict.
-          2. Offload generator.generate_and_parse() to a thread executor.
-          3. Merge both dicts into one record.
-          4. Append to local JSON file.
-          5. Push the full updated list to npoint immediately.
+        With a NearDuplicateIndex, new tools are checked for near-duplicates
+        before enrichment. near_duplicate="merge" adds the variant title to the
+        existing record's Aliases; "flag" saves the record un-enriched with
+        Duplicate_Of set. Either way no generation or post is spent on it.
+
+        With refresh=True, tools already in the catalog are compared by listing
+        fingerprint; changed ones are updated in place (and re-enriched when
+        reenrich_on_change is set), unchanged ones are skipped.
+
+        With a SitemapDiscovery, only the listing pages the sitemaps report as
+        new or changed are crawled, and pagination stops at the first page
+        that holds no new tools. Changed detail pages bypass the
+        detail_scraper cache, and existing tools whose detail page changed
+        are re-read. Only listing pages that could be fetched are committed.
+
+        For each listing page:
+          1. Build raw scraped_data dicts for the cards to save.
+          2. Run the optional stages once over all of them (logos cached locally
+             by logo_pipeline, outbound redirects resolved by link_resolver,
+             detail pages read concurrently by detail_scraper).
+        Then for each of those tools:
+          1. Offload generator.generate_and_parse() to a thread executor.
+          2. Merge both dicts into one record.
+          3. Append to local JSON file.
+          4. Push the full updated list to npoint immediately.
         """
 
         url_queue = [self.current_url] + (extra_urls or [])
@@ -156,7 +295,21 @@ class AI_Tool_Agent:
 
         loop = asyncio.get_event_loop()
 
+        if dedup_index is not None:
+            dedup_index.build(self.load_local())
+            print(f"[Scraper] Near-duplicate index ready ({len(dedup_index)} tools).")
+
+        processed = set()  # discovered URLs handled this run
+        touched   = set()  # slugs scraped this run
         async with aiohttp.ClientSession(headers=self.headers) as session:
+            if discovery:
+                url_queue, self.discovered_detail_urls = await discovery.discover(session)
+                if detail_scraper:
+                    detail_scraper.invalidate(self.discovered_detail_urls)
+                # Stale cache entries now carry the change, so detail URLs are
+                # safe to commit even if their tool is not scraped this run.
+                processed.update(self.discovered_detail_urls)
+
             for start_url in url_queue:
                 self.current_url = start_url
                 print(f"\n[Scraper] === Starting URL: {self.current_url} ===")
@@ -164,6 +317,8 @@ class AI_Tool_Agent:
                     soup = await self.fetch_page(session, self.current_url)
                     if not soup:
                         break
+                    if self.current_url == start_url:
+                        processed.add(start_url)
 
                     post_items = soup.find_all('div', class_='post-item')
                     if not post_items:
@@ -171,66 +326,102 @@ class AI_Tool_Agent:
                         break
 
                     print(f"[Scraper] Found {len(post_items)} tools. Processing...")
-                    existing_slugs = self.get_existing_slugs()
+                    existing    = self.get_existing_fingerprints()
+                    new_on_page = 0
 
+                    # Pass 1: pick the cards to save (new, or changed under refresh)
+                    cards      = []  # (scraped_data, is_update)
+                    page_cards = {}  # slug -> scraped_data of the cards above
                     for item in post_items:
-                        data_element = item.find('div', class_='share-dialog')
-                        if not data_element:
+                        scraped_data = self.parse_post_item(item)
+                        if not scraped_data:
                             continue
 
-                        title       = data_element.get('data-title')
-                        description = data_element.get('data-description')
-                        category    = self.extract_category(item)
-
-                        # Extract direct tool link from the visit button
-                        visit_btn = item.find('a', class_='visit-site-button4')
-                        link = visit_btn['href'] if visit_btn and visit_btn.get('href') else "Unknown"
-
-                        slug = self.create_slug(title)
-
-                        if slug in existing_slugs:
-                            print(f"[Scraper] Skipping duplicate: {title}")
-                            continue
-
-                        # Extract logo
-                        logo_src = "Unknown"
-                        logo_div = item.find('div', class_='favicon-cat-brand')
-                        if logo_div:
-                            img_tag = logo_div.find('img')
-                            if img_tag and 'src' in img_tag.attrs:
-                                logo_src = img_tag['src']
-
-                        scraped_data = {
-                            'Title':       title,
-                            'Slug':        slug,
-                            'Category':    category,
-                            'Description': description,
-                            'Link':        link,
-                            'Logo':        logo_src,
-                            'Scraped_At':  datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                        }
+                        title       = scraped_data['Title']
+                        description = scraped_data['Description']
+                        slug        = scraped_data['Slug']
+
+                        is_update = slug in existing
+                        if is_update:
+                            if not refresh or existing[slug] == scraped_data['Fingerprint']:
+                                print(f"[Scraper] Skipping duplicate: {title}")
+                                continue
+                            print(f"[Scraper] Change detected: {title}")
+                            scraped_data['Updated_At'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                        else:
+                            scraped_data['Scraped_At'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+                        new_on_page += 1
+                        existing[slug] = scraped_data['Fingerprint']
+
+                        if dedup_index is not None and not is_update:
+                            match = dedup_index.find(title, description, exclude=slug)
+                            if match:
+                                original, score, reason = match
+                                print(f"[Scraper] Near-duplicate of '{original}' ({reason} {score:.2f}): {title}")
+                                if near_duplicate == "flag":
+                                    scraped_data['Duplicate_Of'] = original
+                                    updated_data = self.append_to_local(scraped_data)
+                                elif original in page_cards:
+                                    # Original is on this page and not saved yet
+                                    aliases = page_cards[original].setdefault('Aliases', [])
+                                    if title not in aliases:
+                                        aliases.append(title)
+                                    updated_data = None
+                                else:
+                                    updated_data = self.add_alias(original, title)
+                                if updated_data:
+                                    await self.push_to_npoint(session, updated_data)
+                                continue
+                            # Indexed now so a variant later on this page is caught too
+                            dedup_index.add(slug, title, description)
+
+                        cards.append((scraped_data, is_update))
+                        page_cards[slug] = scraped_data
+
+                    # Pass 2: the network stages run once per page, concurrently across its cards
+                    batch = [scraped_data for scraped_data, _ in cards]
+                    if batch and logo_pipeline:
+                        await logo_pipeline.localize(session, batch)
+                    if batch and link_resolver:
+                        await link_resolver.resolve_records(session, batch)
+                    if batch and detail_scraper:
+                        await detail_scraper.enrich(session, batch)
+
+                    # Pass 3: generate and save one tool at a time
+                    for scraped_data, is_update in cards:
+                        title       = scraped_data['Title']
+                        description = scraped_data['Description']
+                        slug        = scraped_data['Slug']
 
                         # Offload blocking generator call to thread executor
-                        if generator:
+                        if generator and (not is_update or reenrich_on_change):
                             print(f"[Scraper] Handing off to Generator: {title}")
                             generated_data = await loop.run_in_executor(
                                 self._executor,
                                 generator.generate_and_parse,
-                                title, description, slug
+                                title, description, slug, scraped_data
                             )
                             merged_entry = {**scraped_data, **generated_data}
                         else:
                             merged_entry = scraped_data
 
                         # Save locally AND push to npoint in one step
-                        updated_data = self.append_to_local(merged_entry)
+                        if is_update:
+                            updated_data = self.update_local(merged_entry)
+                        else:
+                            updated_data = self.append_to_local(merged_entry)
                         await self.push_to_npoint(session, updated_data)
-
-                        existing_slugs.add(slug)
+                        touched.add(slug)
 
                         print(f"[Scraper] Waiting {self.interval} seconds before next extraction...")
                         await asyncio.sleep(self.interval)
 
+                    # New tools are listed first; older pages hold nothing new
+                    if discovery and not new_on_page:
+                        print("[Scraper] No new tools on this page. Ending pagination.")
+                        break
+
                     next_page_link = soup.find('a', class_='next page-numbers')
                     if next_page_link and 'href' in next_page_link.attrs:
                         self.current_url = next_page_link['href']
@@ -238,6 +429,15 @@ class AI_Tool_Agent:
                     else:
                         self.current_url = None
 
+            if detail_scraper and self.discovered_detail_urls:
+                updated_data = await self.refresh_details(session, detail_scraper,
+                                                          self.discovered_detail_urls, skip=touched)
+                if updated_data:
+                    await self.push_to_npoint(session, updated_data)
+
+            if discovery:
+                discovery.commit(processed)
+
             self._executor.shutdown(wait=False)
             print("--- Scraping Agent Finished ---")
 
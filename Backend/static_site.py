@@ -0,0 +1,251 @@
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+from list_fields import to_list
+from serialization import dump_json, load_json
+
+# Bump when the page layout changes so every page is rebuilt once
+TEMPLATE_VERSION = 1
+
+DEFAULT_AUDIENCE = ["Students", "Developers", "Creators", "Businesses"]
+
+
+def bullet_list(items, css="list-disc pl-5 space-y-2"):
+    if not items:
+        return '<p class="text-gray-500">Information not available yet.</p>'
+    return f'<ul class="{css}">' + "".join(f"<li>{escape(i)}</li>" for i in items) + "</ul>"
+
+
+def ad_slot(label):
+    return (f'<div class="ad-slot"><span class="ad-label">Advertisement</span>'
+            f'<span class="text-xs">{label}</span></div>')
+
+
+def render_page(record, alternatives):
+    """
+    Renders one tool page following the structure.md layout.
+    alternatives: [(slug, title), ...] already resolved by the builder.
+    """
+    title       = escape(record.get('Title') or record['Slug'])
+    category    = escape(record.get('Category_Label') or "AI Tool")
+    description = record.get('Description') or ""
+    tagline     = escape(description.split(". ")[0])
+    link        = escape(record.get('Final_Link') or record.get('Link') or "#", quote=True)
+    logo        = record.get('Logo_Local')
+    logo        = escape(f"../{logo}" if logo else (record.get('Logo') or ""), quote=True)
+    features    = to_list(record.get('Key Features'))
+    pricing     = escape(record.get('Pricing') or "Freemium")
+    audience    = record.get('Tags') or DEFAULT_AUDIENCE
+
+    overview = [description] + [p for p in str(record.get('Full_Description') or "").split("\n\n") if p][:3]
+    overview_html = "".join(f'<p class="mb-4">{escape(p)}</p>' for p in overview if p)
+
+    usage = features[:3] or [f"work faster on {category.lower()} tasks"]
+    usage_html = '<ol class="list-decimal pl-5 space-y-2">' + "".join(f"<li>{escape(u)}</li>" for u in usage) + "</ol>"
+
+    alternatives_html = "".join(
+        f'<li><a class="text-blue-600 hover:underline" href="{escape(slug, quote=True)}.html">{escape(alt_title)}</a></li>'
+        for slug, alt_title in alternatives
+    ) or "<li>More tools coming soon.</li>"
+
+    meta_desc = escape(f"Review of {record.get('Title')}. {description}", quote=True)
+
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title} - Review &amp; Features</title>
+    <meta name="description" content="{meta_desc}">
+    <script src="https://cdn.tailwindcss.com"></script>
+    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;600;700;800&display=swap" rel="stylesheet">
+    <style>
+        body {{ font-family: 'Inter', sans-serif; background-color: #f8fafc; color: #334155; }}
+        .ad-slot {{
+            background-color: #e2e8f0; border: 1px dashed #94a3b8; color: #64748b;
+            display: flex; align-items: center; justify-content: center; flex-direction: column;
+            margin: 2rem 0; padding: 1rem; min-height: 250px; border-radius: 0.5rem;
+            text-align: center; font-size: 0.875rem; letter-spacing: 0.05em; text-transform: uppercase;
+        }}
+        .ad-label {{ font-weight: 700; margin-bottom: 0.5rem; opacity: 0.7; }}
+    </style>
+</head>
+<body class="antialiased">
+    <nav class="bg-white border-b border-gray-200">
+        <div class="max-w-4xl mx-auto px-4 h-16 flex items-center">
+            <a href="../index.html" class="font-bold text-xl text-gray-900 tracking-tight">AIxploria</a>
+        </div>
+    </nav>
+
+    <main class="max-w-3xl mx-auto px-4 sm:px-6 lg:px-8 py-10">
+
+        <!-- 1. HERO SECTION -->
+        <section class="text-center mb-12">
+            <img class="h-20 w-20 rounded-full mx-auto object-cover bg-white mb-4" src="{logo}" alt="{title} logo"
+                 referrerpolicy="no-referrer" onerror="this.onerror=null; this.src='https://placehold.co/80x80/e2e8f0/64748b?text=AI'">
+            <span class="bg-blue-100 text-blue-800 text-xs font-semibold px-2.5 py-0.5 rounded border border-blue-200">{category}</span>
+            <h1 class="text-4xl sm:text-5xl font-extrabold text-gray-900 my-4 tracking-tight">{title}</h1>
+            <p class="text-xl text-gray-600 mb-8 max-w-2xl mx-auto leading-relaxed">{tagline}</p>
+            <a href="{link}" target="_blank" rel="nofollow noopener"
+               class="inline-flex items-center px-8 py-4 text-lg font-medium rounded-lg text-white bg-blue-600 hover:bg-blue-700 shadow-lg">
+                Visit Official Website
+            </a>
+        </section>
+
+        <!-- 2. TOP AD SLOT -->
+        {ad_slot("Google AdSense - Top Banner")}
+
+        <!-- 3. OVERVIEW -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">What is {title}?</h2>
+            <div class="text-gray-700 leading-relaxed">{overview_html}</div>
+        </section>
+
+        <!-- 4. KEY FEATURES -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">Key Features</h2>
+            <div class="bg-white rounded-2xl shadow-sm border border-gray-100 p-8 text-gray-700">{bullet_list(features)}</div>
+        </section>
+
+        <!-- 5. HOW PEOPLE USE THIS TOOL -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">How People Use {title}</h2>
+            <p class="mb-4 text-gray-700">Users typically use {title} to:</p>
+            <div class="text-gray-700">{usage_html}</div>
+        </section>
+
+        <!-- 6. MID AD SLOT -->
+        {ad_slot("Google AdSense - In-Article")}
+
+        <!-- 7. WHO SHOULD USE THIS TOOL -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">Who Should Use This Tool</h2>
+            <p class="mb-4 text-gray-700">This tool is ideal for:</p>
+            <div class="text-gray-700">{bullet_list(to_list(audience))}</div>
+        </section>
+
+        <!-- 8. PRICING INFO -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">Pricing</h2>
+            <div class="bg-white p-6 rounded-xl shadow-sm border border-gray-200 text-center">
+                <p class="text-lg text-gray-700">{pricing}</p>
+                <div class="mt-4 text-sm text-gray-500">*Prices are subject to change. Check official website for details.</div>
+            </div>
+        </section>
+
+        <!-- 9. PROS AND CONS -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6 text-center">Pros &amp; Cons</h2>
+            <div class="grid md:grid-cols-2 gap-6">
+                <div class="bg-green-50 p-6 rounded-xl border border-green-100 text-green-900 text-sm">
+                    <h3 class="text-xl font-bold text-green-800 mb-4">Pros</h3>{bullet_list(to_list(record.get('Pros')))}
+                </div>
+                <div class="bg-red-50 p-6 rounded-xl border border-red-100 text-red-900 text-sm">
+                    <h3 class="text-xl font-bold text-red-800 mb-4">Cons</h3>{bullet_list(to_list(record.get('Cons')))}
+                </div>
+            </div>
+        </section>
+
+        <!-- 10. ALTERNATIVES -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">You may also like</h2>
+            <ul class="space-y-2">{alternatives_html}</ul>
+        </section>
+
+        <!-- 11. HOW TO GET STARTED -->
+        <section class="mb-12">
+            <h2 class="text-2xl font-bold text-gray-900 mb-6">How to Get Started</h2>
+            <ol class="list-decimal pl-5 space-y-2 text-gray-700">
+                <li>Visit the official site</li>
+                <li>Sign up</li>
+                <li>Start using {title}</li>
+            </ol>
+        </section>
+
+        <!-- 12. BOTTOM AD SLOT -->
+        {ad_slot("Google AdSense - Multiplex")}
+
+        <!-- 13. FINAL CTA -->
+        <section class="mb-12 text-center">
+            <a href="{link}" target="_blank" rel="nofollow noopener"
+               class="inline-flex items-center px-10 py-5 text-xl font-semibold rounded-lg text-white bg-gray-900 hover:bg-gray-800">
+                Try {title} Now
+            </a>
+        </section>
+
+    </main>
+</body>
+</html>
+"""
+
+
+def render_to_file(job):
+    """Worker entrypoint: (path, record, alternatives) -> writes the page."""
+    path, record, alternatives = job
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(render_page(record, alternatives))
+    return path
+
+
+class StaticSiteBuilder:
+    """
+    Pre-renders one HTML page per tool (tools/<slug>.html) so tool pages
+    load without any API call.
+
+    Builds are incremental: each page's inputs (its record, the titles of
+    the tools it lists as alternatives, and the template version) are
+    hashed, and only pages whose hash changed are rendered. A renamed tool
+    therefore re-renders the pages that link to it as well. Larger batches
+    are rendered in parallel across cores.
+    """
+    PARALLEL_THRESHOLD = 32  # below this, a process pool costs more than it saves
+
+    def __init__(self, out_dir="../Frontend/tools", state_file="static_site_state.json", workers=None):
+        self.out_dir    = out_dir
+        self.state_file = state_file
+        self.workers    = workers
+
+        self.state = {}  # slug -> input hash of the page on disk
+        if os.path.exists(self.state_file):
+            self.state = load_json(self.state_file)
+
+    @staticmethod
+    def page_hash(record, alternatives):
+        payload = json.dumps([TEMPLATE_VERSION, record, alternatives], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def build(self, records):
+        """Renders changed pages, removes pages of unpublished tools. Returns the number rendered."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        titles = {r['Slug']: r.get('Title') or r['Slug'] for r in records}
+
+        jobs, hashes = [], {}
+        for record in records:
+            slug         = record['Slug']
+            alternatives = [(s, titles[s]) for s in record.get('Alternatives') or [] if s in titles]
+            digest       = self.page_hash(record, alternatives)
+            hashes[slug] = digest
+
+            path = os.path.join(self.out_dir, f"{slug}.html")
+            if self.state.get(slug) != digest or not os.path.exists(path):
+                jobs.append((path, record, alternatives))
+
+        if len(jobs) >= self.PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                list(pool.map(render_to_file, jobs, chunksize=16))
+        else:
+            for job in jobs:
+                render_to_file(job)
+
+        for slug in set(self.state) - set(hashes):
+            path = os.path.join(self.out_dir, f"{slug}.html")
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.state = hashes
+        dump_json(self.state, self.state_file)
+
+        print(f"[Pages] Rendered {len(jobs)} of {len(records)} page(s).")
+        return len(jobs)
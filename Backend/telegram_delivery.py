@@ -0,0 +1,103 @@
+import asyncio
+from rate_limiter import TokenBucket
+
+# Delivery outcomes returned by TelegramDeliveryEngine.send_message()
+SENT     = "sent"      # Telegram accepted the message
+REJECTED = "rejected"  # permanent 4xx (bad chat id, bad markup...) — retrying won't help
+FAILED   = "failed"    # transient failure that outlived every retry
+
+
+class TelegramDeliveryEngine:
+    """
+    Sends Telegram messages as fast as the Bot API allows.
+
+    - one global token bucket (~30 msg/s per bot)
+    - one token bucket per chat (~20 msg/min for groups and channels)
+    - 429 responses pause the affected chat for the `retry_after` Telegram returns
+    - 5xx / connection errors are retried per message with exponential backoff,
+      while the other messages of the batch keep flowing
+    """
+    def __init__(self, bot_token, global_rate=30, chat_rate=20 / 60, max_attempts=5, backoff_seconds=2):
+        self.api_url         = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+        self.global_bucket   = TokenBucket(global_rate, capacity=global_rate)
+        self.chat_rate       = chat_rate
+        self.max_attempts    = max_attempts
+        self.backoff_seconds = backoff_seconds
+        self._chat_buckets   = {}
+
+    def _chat_bucket(self, chat_id):
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.chat_rate, capacity=1)
+        return bucket
+
+    # ------------------------------------------------------------------
+    # Single message
+    # ------------------------------------------------------------------
+
+    async def send_message(self, session, chat_id, text, disable_web_page_preview=False):
+        """Sends one message, retrying transient failures. Returns SENT, REJECTED or FAILED."""
+        payload = {
+            "chat_id": chat_id,
+            "text":    text,
+            "disable_web_page_preview": disable_web_page_preview
+        }
+        chat_bucket = self._chat_bucket(chat_id)
+
+        for attempt in range(1, self.max_attempts + 1):
+            await chat_bucket.acquire()
+            await self.global_bucket.acquire()
+
+            try:
+                async with session.post(self.api_url, json=payload) as response:
+                    if response.status == 200:
+                        return SENT
+
+                    try:
+                        body = await response.json(content_type=None)
+                    except Exception:
+                        body = {}
+
+                    if response.status == 429:
+                        retry_after = (body.get("parameters") or {}).get("retry_after", self.backoff_seconds)
+                        print(f"[Delivery] Rate limited on {chat_id}, retrying after {retry_after}s "
+                              f"(attempt {attempt}/{self.max_attempts}).")
+                        chat_bucket.pause(retry_after)
+                        continue
+
+                    if response.status < 500:
+                        print(f"[!] Telegram Rejected Post: {body.get('description', response.status)}")
+                        return REJECTED
+
+                    print(f"[Delivery] Telegram error {response.status} (attempt {attempt}/{self.max_attempts}).")
+            except Exception as e:
+                print(f"[!] Connection Error: {e} (attempt {attempt}/{self.max_attempts})")
+
+            if attempt < self.max_attempts:
+                # Only this message waits; the buckets stay free for the rest of the batch
+                await asyncio.sleep(self.backoff_seconds * 2 ** (attempt - 1))
+
+        return FAILED
+
+    # ------------------------------------------------------------------
+    # Batch
+    # ------------------------------------------------------------------
+
+    async def deliver(self, session, chat_id, messages, on_result=None):
+        """
+        Sends a batch to one chat concurrently. The buckets keep the
+        messages in order and under the limits; a message that has to be
+        retried does not hold up the ones behind it.
+
+        on_result(index, outcome) is called as soon as each message settles,
+        so callers can persist progress per message instead of waiting for
+        the whole batch (which can take minutes at channel rate limits).
+        Returns one outcome per message, in input order.
+        """
+        async def send(index, message):
+            outcome = await self.send_message(session, chat_id, message)
+            if on_result:
+                on_result(index, outcome)
+            return outcome
+
+        return await asyncio.gather(*(send(i, m) for i, m in enumerate(messages)))
@@ -1,90 +1,349 @@
 import json
 import asyncio
 import os
+import re
+import string
+import time
 import aiohttp
 from dotenv import load_dotenv
+from telegram_delivery import TelegramDeliveryEngine, SENT, FAILED
+from posting_ledger import PostedLedger
+from category_taxonomy import category_id, parse_categories
+from list_fields import to_list
+from json_stream import iter_records
+from serialization import load_json
 
 load_dotenv()
 
+# Default post layout. Available fields:
+# {title} {category} {short_desc} {description} {slug} {link} {url}
+TEMPLATE_FIELDS = ("title", "category", "short_desc", "description", "slug", "link", "url")
+DEFAULT_TEMPLATE = (
+    "🚀 {title}\n\n"
+    "🧠 Category: {category}\n"
+    "✨ {short_desc}\n"
+    "💰 Free/Freemium\n"
+    "🔗 Details:\n"
+    "{url}"
+)
+
+# Telegram rejects messages longer than this many characters
+TELEGRAM_MESSAGE_LIMIT = 4096
+
+# The only record fields formatting, filtering and enrichment checks read
+POST_FIELDS = ("Slug", "Title", "Category", "Categories", "Category_Label", "Description", "Link",
+               "Key Features", "Generated_At", "Scraped_At")
+
 
 class TelegramAutoPoster:
-    def __init__(self, json_file="ai_tools.json", state_file="last_posted_index.txt"):
-        self.json_file   = json_file
-        self.state_file  = state_file
-        self.bot_token   = os.getenv("TELEGRAM_BOT_TOKEN")
-        self.channel_id  = os.getenv("TELEGRAM_CHANNEL_ID")
-        self.api_url     = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
-
-        if not self.bot_token or not self.channel_id:
+    def __init__(self, json_file="ai_tools.json", ledger_file="posted_slugs.log", targets=None, max_connections=20,
+                 digest_size=None, digest_window=None, legacy_state_file="last_posted_index.txt"):
+        """
+        targets: optional list of dicts, one per channel:
+            {"chat_id": "@channel", "categories": ["Image", "Video"], "template": "...",
+             "digest_size": 20, "digest_window": 3600}
+        `categories` (category names or ids, matched against the canonical ids),
+        `template` and the digest settings are optional. Without `targets`,
+        the JSON file named by TELEGRAM_TARGETS_FILE is used, else the single
+        TELEGRAM_CHANNEL_ID.
+
+        digest_size:   group up to N tools into one message instead of one post per tool.
+        digest_window: seconds to hold back a digest that is not full yet, so tools
+                       arriving within the window share one message. Without
+                       digest_size, every tool of a window goes into one digest.
+
+        Progress is kept per target as a ledger of posted slugs. An old
+        last_posted_index.txt cursor is imported into the default ledger once.
+        """
+        self.json_file         = json_file
+        self.ledger_file       = ledger_file
+        self.legacy_state_file = legacy_state_file
+        self.max_connections = max_connections
+        self.digest_size     = digest_size
+        self.digest_window   = digest_window
+        self.bot_token       = os.getenv("TELEGRAM_BOT_TOKEN")
+        self.channel_id      = os.getenv("TELEGRAM_CHANNEL_ID")
+        self.targets         = self.load_targets(targets)
+
+        if not self.bot_token or not self.targets:
             raise ValueError("Missing Telegram credentials in .env file.")
 
+        self.delivery        = TelegramDeliveryEngine(self.bot_token)
+
     # ------------------------------------------------------------------
-    # State helpers (synchronous — just file I/O, fine to call from async)
+    # Targets
     # ------------------------------------------------------------------
 
-    def get_last_posted_index(self):
-        """Reads the state file to track progress."""
-        if os.path.exists(self.state_file):
-            with open(self.state_file, "r") as f:
-                try:
-                    return int(f.read().strip())
-                except ValueError:
-                    return -1
-        return -1
+    def load_targets(self, targets):
+        """Normalizes the target list and gives every target its own posted-ledger."""
+        if targets is None:
+            targets_file = os.getenv("TELEGRAM_TARGETS_FILE")
+            if targets_file and os.path.exists(targets_file):
+                targets = load_json(targets_file)
+            elif self.channel_id:
+                # Single-channel setup keeps using the original progress files
+                targets = [{"chat_id": self.channel_id, "ledger_file": self.ledger_file,
+                            "legacy_state_file": self.legacy_state_file}]
+            else:
+                targets = []
+
+        normalized = []
+        for target in targets:
+            chat_id = str(target["chat_id"])
+            safe_id = re.sub(r"[^A-Za-z0-9_-]", "", chat_id)
+            template = target.get("template") or DEFAULT_TEMPLATE
+            self.check_template(template, chat_id)
+            normalized.append({
+                "chat_id":    chat_id,
+                "categories": {category_id(c) for c in target.get("categories") or []},
+                "template":   template,
+                "ledger":     PostedLedger(target.get("ledger_file") or f"posted_slugs_{safe_id}.log"),
+                "legacy_state_file": target.get("legacy_state_file"),
+                "digest_size":   target.get("digest_size", self.digest_size),
+                "digest_window": target.get("digest_window", self.digest_window),
+                "sent_parts":    set(),  # parts of unfinished multi-message units already delivered
+            })
+        return normalized
+
+    @staticmethod
+    def check_template(template, chat_id):
+        """Raises ValueError if the template uses an unknown field or is malformed ('{' must be written '{{')."""
+        try:
+            fields = [name for _, name, _, _ in string.Formatter().parse(template) if name is not None]
+            unknown = sorted({name for name in fields if name not in TEMPLATE_FIELDS})
+            if unknown:
+                raise ValueError(f"unknown field(s) {', '.join('{' + n + '}' for n in unknown)}; "
+                                 f"available: {', '.join('{' + n + '}' for n in TEMPLATE_FIELDS)}")
+            template.format(**{name: "" for name in TEMPLATE_FIELDS})
+        except (ValueError, KeyError, IndexError) as e:
+            raise ValueError(f"Invalid template for target {chat_id}: {e}") from None
 
-    def update_last_posted_index(self, index):
-        """Saves progress so we don't double-post after a crash."""
-        with open(self.state_file, "w") as f:
-            f.write(str(index))
+    def matches_target(self, tool, target):
+        """True if the tool passes the target's category filter (no filter = everything)."""
+        if not target["categories"]:
+            return True
+        ids = tool.get("Categories")
+        if ids is None:
+            ids = [cid for cid, _ in parse_categories(tool.get("Category"))]
+        return not target["categories"].isdisjoint(ids)
 
     # ------------------------------------------------------------------
     # Formatting
     # ------------------------------------------------------------------
 
-    def format_message(self, tool_name, category, description, slug):
+    def format_message(self, tool_name, category, description, slug, template=None, link=""):
         """Constructs the Telegram post message."""
         words      = str(description).split()
         short_desc = " ".join(words[:10])
 
-        return (
-            f"🚀 {tool_name}\n\n"
-            f"🧠 Category: {category}\n"
-            f"✨ {short_desc}\n"
-            f"💰 Free/Freemium\n"
-            f"🔗 Details:\n"
-            f"https://tool-hive-ai.vercel.app/?slug={slug}"
+        return (template or DEFAULT_TEMPLATE).format(
+            title=tool_name,
+            category=category,
+            short_desc=short_desc,
+            description=description,
+            slug=slug,
+            link=link,
+            url=f"https://tool-hive-ai.vercel.app/?slug={slug}",
         )
 
+    def category_label(self, tool):
+        if tool.get("Category_Label"):
+            return tool["Category_Label"]
+        pairs = parse_categories(tool.get("Category"))
+        return pairs[0][1] if pairs else "AI Tool"
+
+    def format_tool(self, tool, template=None):
+        t_cat = self.category_label(tool)
+        return self.format_message(
+            tool.get("Title", "Unknown"), t_cat, tool.get("Description", ""),
+            tool.get("Slug", ""), template=template, link=tool.get("Link", "")
+        )
+
+    def format_digest(self, tools):
+        """
+        Builds one digest listing every tool with its link. Returns a list of
+        messages, split so none exceeds Telegram's length limit.
+        """
+        entries = []
+        for tool in tools:
+            t_cat = self.category_label(tool)
+            entries.append(
+                f"🚀 {tool.get('Title', 'Unknown')} — {t_cat}\n"
+                f"https://tool-hive-ai.vercel.app/?slug={tool.get('Slug', '')}\n"
+            )
+
+        header   = f"🆕 {len(tools)} new AI tools\n\n"
+        messages = []
+        current  = header
+        for entry in entries:
+            if len(current) + len(entry) + 1 > TELEGRAM_MESSAGE_LIMIT and current != header:
+                messages.append(current.rstrip())
+                current = ""
+            current += entry + "\n"
+        messages.append(current.rstrip())
+        return messages
+
+    def tool_timestamp(self, tool):
+        """Epoch seconds of when the tool became ready (Generated_At, else Scraped_At)."""
+        stamp = tool.get("Generated_At") or tool.get("Scraped_At")
+        try:
+            return time.mktime(time.strptime(stamp, "%Y-%m-%d %H:%M:%S"))
+        except (TypeError, ValueError):
+            return 0
+
     # ------------------------------------------------------------------
     # Guard: only post once both agents have written their data
     # ------------------------------------------------------------------
 
     def is_fully_enriched(self, tool):
         """A record is complete when the generator has added Key Features."""
-        key_features = tool.get("Key Features", "")
-        return bool(key_features) and key_features != "N/A"
+        return bool(to_list(tool.get("Key Features")))
 
     # ------------------------------------------------------------------
     # Async HTTP post to Telegram
     # ------------------------------------------------------------------
 
-    async def post_to_telegram(self, session, message):
-        """Sends the message to Telegram using an async aiohttp session."""
-        payload = {
-            "chat_id": self.channel_id,
-            "text":    message,
-            "disable_web_page_preview": False
-        }
-        try:
-            async with session.post(self.api_url, json=payload) as response:
-                if response.status != 200:
-                    text = await response.text()
-                    print(f"[!] Telegram Rejected Post: {text}")
-                    return False
-                return True
-        except Exception as e:
-            print(f"[!] Connection Error: {e}")
-            return False
+    async def post_to_telegram(self, session, message, chat_id=None):
+        """Sends one message through the rate-limited delivery engine."""
+        return await self.delivery.send_message(session, chat_id or self.targets[0]["chat_id"], message) == SENT
+
+    # ------------------------------------------------------------------
+    # Per-target posting
+    # ------------------------------------------------------------------
+
+    async def post_pending(self, session, target, data):
+        """
+        Posts every enriched record that is not in this target's ledger yet.
+        Records are checked independently, so one slow enrichment no longer
+        blocks the records behind it. `data` may be any iterable of records,
+        e.g. a stream from iter_records().
+        """
+        chat_id = target["chat_id"]
+        ledger  = target["ledger"]
+
+        pending = []
+        seen    = set()
+        for tool in data:
+            slug = tool.get("Slug")
+            if not slug or slug in ledger or slug in seen:
+                continue
+            # Wait for generator data before posting
+            if not self.is_fully_enriched(tool) or not self.matches_target(tool, target):
+                continue
+            seen.add(slug)
+            pending.append(tool)
+
+        if not pending:
+            return
+
+        units = self.build_units(target, pending)
+        messages = [message for _, unit_messages in units for message in unit_messages]
+        if not messages:
+            return
+
+        # Parts of a split digest that went out in an earlier cycle are not sent again
+        sent_parts = target["sent_parts"]
+        outgoing, unit_of = [], []
+        remaining = []
+        for u, (_, unit_messages) in enumerate(units):
+            todo = [m for m in unit_messages if m not in sent_parts]
+            outgoing += todo
+            unit_of  += [u] * len(todo)
+            remaining.append(len(todo))
+        failed = [False] * len(units)
+        sent   = 0
+
+        def finish(u):
+            tools, unit_messages = units[u]
+            if failed[u]:
+                print(f"[-] Failed on {chat_id}: {', '.join(t.get('Title', '?') for t in tools)}. Retrying in next cycle.")
+                return
+            # Delivered (or permanently rejected) units are persisted right away,
+            # so a crash mid-batch never re-posts what already went out
+            ledger.add(tool.get("Slug") for tool in tools)
+            sent_parts.difference_update(unit_messages)
+
+        def on_result(index, outcome):
+            nonlocal sent
+            u = unit_of[index]
+            if outcome == FAILED:
+                failed[u] = True
+            elif outcome == SENT:
+                sent += 1
+                sent_parts.add(outgoing[index])
+            remaining[u] -= 1
+            if remaining[u] == 0:
+                finish(u)
+
+        for u, count in enumerate(remaining):
+            if count == 0:
+                finish(u)  # every part already went out in an earlier cycle
+
+        if not outgoing:
+            return
+        print(f"[*] Posting {len(outgoing)} message(s) to {chat_id}...")
+        await self.delivery.deliver(session, chat_id, outgoing, on_result=on_result)
+        print(f"[+] Delivered {sent}/{len(outgoing)} to {chat_id}.")
+
+    def build_units(self, target, pending):
+        """
+        Turns pending tools into delivery units of (tools, messages).
+        One unit per tool normally; in digest mode one unit per digest of
+        up to `digest_size` tools. A digest that is not full yet is held
+        back until its oldest tool has waited `digest_window` seconds.
+        With only `digest_window`, each unit is every tool whose timestamp
+        falls in one window, sent once that window has closed.
+        """
+        digest_size = target["digest_size"]
+        window      = target["digest_window"]
+
+        if not digest_size and not window:
+            return [([tool], [self.format_tool(tool, target["template"])]) for tool in pending]
+
+        if not digest_size:
+            units = []
+            rest  = sorted(pending, key=self.tool_timestamp)
+            while rest:
+                opened = self.tool_timestamp(rest[0])
+                if time.time() - opened < window:
+                    break
+                group = [tool for tool in rest if self.tool_timestamp(tool) < opened + window]
+                rest  = rest[len(group):]
+                units.append((group, self.format_digest(group)))
+            return units
+
+        units = []
+        for start in range(0, len(pending), digest_size):
+            group = pending[start:start + digest_size]
+            if len(group) < digest_size:
+                oldest = min(self.tool_timestamp(tool) for tool in group)
+                if window and time.time() - oldest < window:
+                    break
+            units.append((group, self.format_digest(group)))
+        return units
+
+    async def monitor_target(self, session, target, check_interval):
+        """Independent loop per target so a slow channel never delays the others."""
+        while True:
+            if os.path.exists(self.json_file):
+                try:
+                    ledger = target["ledger"]
+                    if target["legacy_state_file"]:
+                        ledger.migrate_from_index(target["legacy_state_file"],
+                                                  iter_records(self.json_file, fields=("Slug",)))
+                        target["legacy_state_file"] = None
+
+                    # Stream the catalog: only unposted records are ever held in memory
+                    data = iter_records(self.json_file, fields=POST_FIELDS,
+                                        where=lambda tool: tool.get("Slug") not in ledger)
+                    await self.post_pending(session, target, data)
+
+                except json.JSONDecodeError:
+                    pass  # File may be mid-write; skip this cycle
+                except Exception as e:
+                    print(f"[Poster:{target['chat_id']}] Unexpected error: {e}")
+
+            await asyncio.sleep(check_interval)
 
     # ------------------------------------------------------------------
     # Main async monitoring loop
@@ -93,51 +352,16 @@ class TelegramAutoPoster:
     async def monitor_and_post_async(self, check_interval=30):
         """
         Async loop — watches the shared JSON for fully-enriched entries
-        and posts them to Telegram. Runs concurrently with the scraper.
+        and posts them to every target channel concurrently over one
+        pooled HTTP session. Runs concurrently with the scraper.
         """
-        print("--- Telegram Auto-Poster Started ---")
-
-        async with aiohttp.ClientSession() as session:
-            while True:
-                if os.path.exists(self.json_file):
-                    try:
-                        with open(self.json_file, "r") as f:
-                            data = json.load(f)
-
-                        last_index = self.get_last_posted_index()
-
-                        if len(data) > last_index + 1:
-                            for i in range(last_index + 1, len(data)):
-                                tool = data[i]
-
-                                # Wait for generator data before posting
-                                if not self.is_fully_enriched(tool):
-                                    print(f"[Poster] Waiting — '{tool.get('Title', '?')}' not fully enriched yet.")
-                                    break
-
-                                t_name = tool.get("Title", "Unknown")
-                                t_slug = tool.get("Slug", "")
-                                t_desc = tool.get("Description", "")
-                                t_cat  = str(tool.get("Category", "AI Tool")).replace("#", "").strip()
-
-                                message = self.format_message(t_name, t_cat, t_desc, t_slug)
-
-                                print(f"[*] Posting: {t_name}...")
-                                if await self.post_to_telegram(session, message):
-                                    print(f"[+] Success.")
-                                    self.update_last_posted_index(i)
-                                    # Yield control back to the event loop while waiting
-                                    await asyncio.sleep(5)
-                                else:
-                                    print(f"[-] Failed. Retrying in next cycle.")
-                                    break
-
-                    except json.JSONDecodeError:
-                        pass  # File may be mid-write; skip this cycle
-                    except Exception as e:
-                        print(f"[Poster] Unexpected error: {e}")
-
-                await asyncio.sleep(check_interval)
+        print(f"--- Telegram Auto-Poster Started ({len(self.targets)} target(s)) ---")
+
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(*(
+                self.monitor_target(session, target, check_interval) for target in self.targets
+            ))
 
 
 if __name__ == "__main__":
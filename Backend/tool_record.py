@@ -0,0 +1,184 @@
+import calendar
+import sys
+import time
+from array import array
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# JSON key -> attribute, by kind. Anything else on a record goes to `extra`.
+# Slugs are interned because every Alternatives list repeats other tools' slugs.
+STRING_FIELDS = {
+    'Title': 'title', 'Description': 'description', 'Link': 'link', 'Logo': 'logo',
+    'Detail_URL': 'detail_url', 'Fingerprint': 'fingerprint', 'Final_Link': 'final_link',
+    'Logo_Local': 'logo_local',
+}
+INTERNED_FIELDS = {'Slug': 'slug', 'Category': 'category', 'Category_Label': 'category_label'}
+INTERNED_LISTS  = {'Categories', 'Alternatives', 'Aliases'}
+LIST_FIELDS     = {
+    'Categories': 'categories', 'Key Features': 'key_features', 'Pros': 'pros', 'Cons': 'cons',
+    'Alternatives': 'alternatives', 'Aliases': 'aliases',
+}
+TIME_FIELDS     = {'Scraped_At': 'scraped_at', 'Generated_At': 'generated_at', 'Updated_At': 'updated_at'}
+
+FIELD_ORDER = [*STRING_FIELDS, *INTERNED_FIELDS, *LIST_FIELDS, *TIME_FIELDS]
+ATTRIBUTES  = {**STRING_FIELDS, **INTERNED_FIELDS, **LIST_FIELDS, **TIME_FIELDS}
+
+
+def to_epoch(stamp):
+    """'2026-02-22 13:29:30' -> int seconds, or None if the string would not round-trip exactly."""
+    # Fixed-width slicing; strptime is ~10x slower and this runs once per field per record
+    try:
+        epoch = calendar.timegm((int(stamp[0:4]), int(stamp[5:7]), int(stamp[8:10]),
+                                 int(stamp[11:13]), int(stamp[14:16]), int(stamp[17:19])))
+    except (TypeError, ValueError):
+        return None
+    return epoch if from_epoch(epoch) == stamp else None
+
+
+def from_epoch(epoch):
+    # The stamp is treated as UTC purely as an encoding, so no timezone shifts a value
+    t = time.gmtime(epoch)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+class ToolRecord:
+    """
+    Compact in-memory form of one catalog record.
+
+    Fixed attributes instead of a per-record dict, category strings and ids
+    interned so every record shares one copy, list fields as tuples and
+    timestamps as integer epoch seconds. Values of unexpected type and
+    unknown keys are kept verbatim in `extra`, so
+    ToolRecord.from_dict(d).to_dict() == d for any record.
+    """
+    __slots__ = tuple(ATTRIBUTES.values()) + ('extra',)
+
+    def __init__(self):
+        for attr in self.__slots__:
+            setattr(self, attr, None)
+
+    @classmethod
+    def from_dict(cls, data):
+        record = cls()
+        extra  = {}
+        for key, value in data.items():
+            attr = ATTRIBUTES.get(key)
+            if attr is None:
+                extra[key] = value
+            elif key in STRING_FIELDS and isinstance(value, str):
+                setattr(record, attr, value)
+            elif key in INTERNED_FIELDS and isinstance(value, str):
+                setattr(record, attr, sys.intern(value))
+            elif key in LIST_FIELDS and isinstance(value, list) and all(isinstance(v, str) for v in value):
+                setattr(record, attr, tuple(map(sys.intern, value)) if key in INTERNED_LISTS else tuple(value))
+            elif key in TIME_FIELDS and (epoch := to_epoch(value)) is not None:
+                setattr(record, attr, epoch)
+            else:
+                extra[key] = value
+        record.extra = extra or None
+        return record
+
+    def to_dict(self):
+        data = {}
+        for key in FIELD_ORDER:
+            value = getattr(self, ATTRIBUTES[key])
+            if value is None:
+                continue
+            if key in LIST_FIELDS:
+                value = list(value)
+            elif key in TIME_FIELDS:
+                value = from_epoch(value)
+            data[key] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @property
+    def timestamp(self):
+        """Epoch of when the tool became ready (Generated_At, else Scraped_At), 0 if unknown."""
+        return self.generated_at or self.scraped_at or 0
+
+
+class ColumnarCatalog:
+    """
+    Column view over a list of ToolRecords for bulk scans: categories are
+    small integer codes, timestamps sit in flat int64 arrays, so filters
+    and sorts touch a few compact columns instead of every record object.
+    """
+    def __init__(self, records):
+        self.records      = list(records)
+        self.slugs        = [r.slug for r in self.records]
+        self.category_ids = []                # code -> category id
+        self.codes        = {}                # category id -> code
+        self.category     = array('H')        # primary category code per row
+        self.timestamp    = array('q', (r.timestamp for r in self.records))
+
+        for record in self.records:
+            cid  = record.categories[0] if record.categories else ""
+            code = self.codes.get(cid)
+            if code is None:
+                code = self.codes[cid] = len(self.category_ids)
+                self.category_ids.append(cid)
+            self.category.append(code)
+
+    def __len__(self):
+        return len(self.records)
+
+    def rows_in_category(self, cid):
+        code = self.codes.get(cid)
+        return [] if code is None else [i for i, c in enumerate(self.category) if c == code]
+
+    def newest(self, n):
+        """Row indices of the n most recent tools, newest first."""
+        return sorted(range(len(self.timestamp)), key=self.timestamp.__getitem__, reverse=True)[:n]
+
+
+def synthetic_catalog(n):
+    """Realistic-shaped records for the memory benchmark."""
+    categories = ["#AIxploria Selection#Image Generators+1", "#LLM models", "#Music", "#AI Agents", "#Video Editing"]
+    records = []
+    for i in range(n):
+        category = categories[i % len(categories)]
+        label    = category.split("#")[-1].split("+")[0]
+        records.append({
+            'Title': f"Tool {i}", 'Slug': f"tool-{i}", 'Category': category,
+            'Description': f"Tool {i} helps creators produce eye-catching assets quickly with AI models.",
+            'Link': f"https://www.aixploria.com/out/Tool{i}",
+            'Logo': f"https://s2.googleusercontent.com/s2/favicons?sz=64&domain_url=https://tool{i}.ai",
+            'Scraped_At': from_epoch(1760000000 + i),
+            'Key Features': [f"Generates assets for use case {k} of tool {i}." for k in range(4)],
+            'Pros': [f"Saves time on task {k}." for k in range(3)],
+            'Cons': [f"Limited control over option {k}." for k in range(2)],
+            'Generated_At': from_epoch(1760000600 + i),
+            'Categories': [label.lower().replace(" ", "-")], 'Category_Label': label,
+            'Alternatives': [f"tool-{(i + k) % n}" for k in range(1, 6)],
+        })
+    return records
+
+
+if __name__ == "__main__":
+    # Benchmark: traced memory of the catalog as dicts vs ToolRecords, plus a lossless check
+    import json
+    import tracemalloc
+
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    raw = json.dumps(synthetic_catalog(N))  # only the parsed copies below are measured
+
+    tracemalloc.start()
+    dicts = json.loads(raw)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    records = [ToolRecord.from_dict(d) for d in json.loads(raw)]
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    catalog = ColumnarCatalog(records)
+    column_bytes = tracemalloc.get_traced_memory()[0] - record_bytes
+    tracemalloc.stop()
+
+    assert all(r.to_dict() == d for r, d in zip(records, dicts)), "round trip is not lossless"
+    print(f"[ToolRecord] {N:,} records")
+    print(f"[ToolRecord]   dicts       {dict_bytes / N:8.0f} B/record")
+    print(f"[ToolRecord]   ToolRecord  {record_bytes / N:8.0f} B/record  ({dict_bytes / record_bytes:.1f}x smaller)")
+    print(f"[ToolRecord]   + columns   {column_bytes / N:8.0f} B/record")
+    print("[ToolRecord]   round trip  lossless")